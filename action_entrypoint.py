@@ -8,16 +8,36 @@ Supports:
 - verify-shell: Lint shell scripts for RCE patterns
 """
 import os
+import re
 import sys
+import ast
 import json
 import glob
-from pathlib import Path
+import atexit
+import hashlib
+import sqlite3
+import subprocess
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
 try:
     import sentry_sdk
 except ImportError:
     sentry_sdk = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
 # QWED SDK imports - only guards (no heavy dependencies)
 sys.path.insert(0, "/app")
 from qwed_sdk.guards.system_guard import SystemGuard
@@ -30,37 +50,539 @@ def get_env(name: str, default: str = "") -> str:
     return os.environ.get(f"INPUT_{name.upper()}", default)
 
 
+# Outputs are collected here and written to GITHUB_OUTPUT once, at exit
+_OUTPUT_BUFFER = []
+_OUTPUT_PID = os.getpid()
+
+
 def set_output(name: str, value: str):
     """Set GitHub Action output."""
-    output_file = os.environ.get("GITHUB_OUTPUT")
-    if output_file:
-        # Validate path to prevent path traversal (defense-in-depth)
-        output_path = os.path.realpath(output_file)
-        cwd = os.path.realpath(os.getcwd())
-        # Canonical containment check using commonpath
-        allowed_roots = ["/home/runner", "/github", cwd]
-        try:
-            if not any(os.path.commonpath([root, output_path]) == root for root in allowed_roots):
-                print(f"⚠️  Suspicious GITHUB_OUTPUT path: {output_file}")
-                return
-        except ValueError:
-            # commonpath raises ValueError if paths are on different drives (Windows)
-            print(f"⚠️  Invalid GITHUB_OUTPUT path: {output_file}")
+    if os.environ.get("GITHUB_OUTPUT"):
+        _OUTPUT_BUFFER.append((name, value))
+    else:
+        print(f"::set-output name={name}::{value}")  # Legacy fallback
+
+
+def _format_output(name: str, value: str) -> str:
+    """One GITHUB_OUTPUT entry; multi-line values use the heredoc form."""
+    if "\n" not in value and "\r" not in value:
+        return f"{name}={value}\n"
+    delimiter = f"ghadelimiter_{uuid.uuid4()}"
+    while delimiter in value:
+        delimiter = f"ghadelimiter_{uuid.uuid4()}"
+    return f"{name}<<{delimiter}\n{value}\n{delimiter}\n"
+
+
+@atexit.register
+def _flush_outputs():
+    """Write all buffered outputs to GITHUB_OUTPUT in a single append."""
+    if not _OUTPUT_BUFFER or os.getpid() != _OUTPUT_PID:
+        return  # Nothing to do, or a forked worker holding a copy
+    outputs = _OUTPUT_BUFFER[:]
+    _OUTPUT_BUFFER.clear()
+    output_file = os.environ.get("GITHUB_OUTPUT", "")
+    # Validate path to prevent path traversal (defense-in-depth)
+    output_path = os.path.realpath(output_file)
+    cwd = os.path.realpath(os.getcwd())
+    # Canonical containment check using commonpath
+    allowed_roots = ["/home/runner", "/github", cwd]
+    try:
+        if any(os.path.commonpath([root, output_path]) == root for root in allowed_roots):
+            # deepcode ignore PT: Path validated with commonpath containment check
+            with open(output_path, "a") as f:
+                f.write("".join(_format_output(name, value) for name, value in outputs))
             return
-        # deepcode ignore PT: Path validated with commonpath containment check
-        with open(output_path, "a") as f:
-            f.write(f"{name}={value}\n")
-    print(f"::set-output name={name}::{value}")  # Legacy fallback
+        print(f"⚠️  Suspicious GITHUB_OUTPUT path: {output_file}")
+    except ValueError:
+        # commonpath raises ValueError if paths are on different drives (Windows)
+        print(f"⚠️  Invalid GITHUB_OUTPUT path: {output_file}")
+    for name, value in outputs:
+        print(f"::set-output name={name}::{value}")  # Legacy fallback
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+
+def _glob_part_to_regex(part: str) -> str:
+    """Translate one glob path component; wildcards never cross '/'."""
+    out = []
+    i, n = 0, len(part)
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1 if i < n and part[i] == "!" else i
+            j = part.find("]", j + 1 if j < n and part[j] == "]" else j)
+            if j < 0:
+                out.append("\\[")
+                continue
+            stuff = part[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if stuff.startswith("!"):
+                stuff = "^/" + stuff[1:]
+            elif stuff.startswith("^"):
+                stuff = "\\" + stuff
+            out.append(f"[{stuff}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translate a Path.glob pattern to a regex over relative file paths.
+
+    A trailing '**' matches every file below it, as Path.glob does from
+    Python 3.13 (earlier versions matched only directories there).
+    """
+    parts = [p for p in pattern.split("/") if p not in ("", ".")]
+    regex = []
+    for idx, part in enumerate(parts):
+        last = idx == len(parts) - 1
+        if part == "**":
+            regex.append(".+" if last else "(?:[^/]+/)*")
+        else:
+            regex.append(_glob_part_to_regex(part) + ("" if last else "/"))
+    return "".join(regex)
+
+
+def _gitignored() -> Optional[frozenset]:
+    """
+    Paths under the working directory that .gitignore rules exclude.
 
+    Ignored directories are listed once, with a trailing '/'. Uses git
+    when the workspace is a repository (honouring nested .gitignore
+    files), else the top-level .gitignore via pathspec if installed.
+    Returns None when neither is available.
+    """
+    cwd = os.getcwd()
+    try:
+        # safe.directory: the workspace is often owned by another uid in
+        # the action container; scope the exception to this one repo
+        out = subprocess.run(
+            ["git", "-c", f"safe.directory={cwd}", "ls-files", "-z",
+             "--others", "--ignored", "--exclude-standard", "--directory"],
+            capture_output=True, check=True, timeout=60,
+        ).stdout
+        return frozenset(os.fsdecode(p) for p in out.split(b"\0") if p)
+    except (OSError, subprocess.SubprocessError):
+        pass
+    
+    if pathspec is None or not os.path.isfile(".gitignore"):
+        return None
+    with open(".gitignore") as fh:
+        spec = pathspec.PathSpec.from_lines("gitwildmatch", fh)
+    ignored = set()
+    for current, dirnames, filenames in os.walk("."):
+        rel = current[2:]
+        prefix = f"{rel}/" if rel else ""
+        for name in list(dirnames):
+            if spec.match_file(f"{prefix}{name}/"):
+                ignored.add(f"{prefix}{name}/")
+                dirnames.remove(name)
+        ignored.update(f"{prefix}{name}" for name in filenames if spec.match_file(f"{prefix}{name}"))
+    return frozenset(ignored)
+
+
+def _walk_files(root: str, ignored: frozenset = frozenset()):
+    """
+    Yield file paths under root, depth-first in the same order as Path.glob.
+    Paths in ignored (directories with a trailing '/') are pruned.
+
+    Symlinked directories below root are never entered. Path.glob already
+    skipped them for '**'; unlike Path.glob, '*' components skip them too,
+    so a link cannot pull files from outside the tree into a scan.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(current or ".") as entries:
+                for entry in entries:
+                    path = f"{current}/{entry.name}" if current else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if f"{path}/" not in ignored:
+                            subdirs.append(path)
+                    elif entry.is_file() and path not in ignored:
+                        yield path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
 
-def expand_paths(patterns: str) -> list[Path]:
-    """Expand glob patterns to file paths."""
+
+def expand_paths(patterns: str, respect_gitignore: bool = True) -> list[str]:
+    """
+    Expand comma-separated glob patterns to file paths with a single tree walk.
+
+    With QWED_RESPECT_GITIGNORE=1 (off by default), wildcard matches skip
+    files excluded by .gitignore; respect_gitignore=False disables that
+    for scans that must see ignored files. Explicitly named files are
+    always kept.
+    """
+    globs = [p.strip() for p in patterns.split(",") if p.strip()]
+    matcher = re.compile("|".join(f"(?:{_glob_to_regex(g)})" for g in globs))
+    
     files = []
-    for pattern in patterns.split(","):
-        pattern = pattern.strip()
-        if pattern:
-            files.extend(Path(".").glob(pattern.strip()))
-    return [f for f in files if f.is_file()]
+    roots = {}  # Ordered set: walk roots in pattern order
+    for pattern in globs:
+        parts = [p for p in pattern.split("/") if p not in ("", ".")]
+        literal = []
+        for part in parts:
+            if any(ch in part for ch in "*?["):
+                break
+            literal.append(part)
+        if len(literal) == len(parts):
+            # No wildcards: a plain file path
+            if parts and os.path.isfile("/".join(parts)):
+                files.append("/".join(parts))
+        else:
+            roots.setdefault("/".join(literal))
+    
+    ignored = None
+    if roots and respect_gitignore and os.environ.get("QWED_RESPECT_GITIGNORE", "0") == "1":
+        ignored = _gitignored()
+    
+    # Walk each directory once, skipping roots nested inside another root
+    for root in roots:
+        if any(not r or root.startswith(f"{r}/") for r in roots if r != root):
+            continue
+        # Ignore rules only describe paths below the working directory
+        skip = ignored if ignored and not root.startswith("..") else frozenset()
+        files.extend(p for p in _walk_files(root, skip) if matcher.fullmatch(p))
+    
+    return list(dict.fromkeys(files))
+
+
+# ============== SCAN CACHE ==============
+class ScanCache:
+    """
+    On-disk memo of per-file scan-code findings.
+
+    Entries are keyed by absolute path and validated against a cheap
+    fingerprint (mtime, size, BLAKE2 of the first/last 4 KiB), so
+    unchanged files are not re-parsed on later runs. Opt-in via the
+    QWED_SCAN_CACHE=1 environment variable. Database errors (a locked or
+    corrupt file) never fail a scan: reads count as misses and pending
+    writes are dropped.
+    """
+
+    # Bump when the scan-code rules change to invalidate old entries
+    VERSION = b"scan-code-v1"
+    BATCH_SIZE = 200
+    EDGE_BYTES = 4096
+
+    def __init__(self, db_path: str, timeout: float = 5.0):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=timeout)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "hash BLOB, findings_json BLOB)"
+        )
+        self._pending = []
+
+    @classmethod
+    def from_env(cls) -> Optional["ScanCache"]:
+        """Open the user cache if QWED_SCAN_CACHE=1, else return None."""
+        if os.environ.get("QWED_SCAN_CACHE") != "1":
+            return None
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        try:
+            return cls(os.path.join(cache_home, "qwed", "scan_code.sqlite"))
+        except (OSError, sqlite3.Error) as e:
+            print(f"   ⚠️  Scan cache disabled: {e}")
+            return None
+
+    def fingerprint(self, filepath: str) -> tuple:
+        """Return (key, mtime_ns, size, hash) for a file."""
+        st = os.stat(filepath)
+        with open(filepath, "rb") as fh:
+            edges = fh.read(self.EDGE_BYTES)
+            if st.st_size > 2 * self.EDGE_BYTES:
+                fh.seek(-self.EDGE_BYTES, os.SEEK_END)
+                edges += fh.read()
+        digest = hashlib.blake2b(edges, digest_size=16, person=self.VERSION).digest()
+        return (os.path.abspath(filepath), st.st_mtime_ns, st.st_size, digest)
+
+    def get(self, fp: tuple) -> Optional[list]:
+        """Return cached findings for a fingerprint, or None on a miss."""
+        try:
+            row = self._conn.execute(
+                "SELECT findings_json FROM cache WHERE path=? AND mtime_ns=? AND size=? AND hash=?",
+                fp,
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put(self, fp: tuple, file_findings: list):
+        """Queue findings for a fingerprint; written in batches."""
+        self._pending.append((*fp, json.dumps(file_findings).encode()))
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)", self._pending
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"   ⚠️  Scan cache not updated: {e}")
+                try:
+                    self._conn.rollback()
+                except sqlite3.Error:
+                    pass
+            self._pending = []
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+
+# ============== PER-FILE SCANNERS ==============
+# Module-level (picklable) so large batches can run in worker processes.
+# Each returns (findings, error) where error is None on success.
+
+# Below this many files, worker startup costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Default ceiling on collected findings (max_findings input, 0 = no limit)
+DEFAULT_MAX_FINDINGS = 0
+
+# Files above this size are read into a single preallocated buffer
+LARGE_FILE_BYTES = 1 << 20
+
+DANGEROUS_CALLS = frozenset(["eval", "exec", "compile", "__import__", "subprocess", "os.system"])
+DANGEROUS_ATTRS = frozenset(["system", "popen", "call", "run"])
+DANGEROUS_IMPORTS = frozenset(["os", "subprocess", "sys", "shutil"])
+
+# Every finding needs one of these identifiers as a whole token in the
+# source, so files without any of them can skip ast.parse entirely
+_PY_PREFILTER = re.compile(rb"\b(?:%s)\b" % b"|".join(
+    re.escape(name.encode())
+    for name in sorted({part for call in DANGEROUS_CALLS for part in call.split(".")}
+                       | DANGEROUS_ATTRS | DANGEROUS_IMPORTS)
+))
+
+
+# AST fields that never hold child nodes worth visiting; ``ctx`` alone is
+# a Load/Store/Del node on every Name, Attribute and Subscript
+_AST_SKIP_FIELDS = frozenset(["ctx", "type_comment"])
+_AST_CHILD_FIELDS = {}
+
+
+def _walk_ast(tree: ast.AST):
+    """
+    Yield every node in breadth-first order, like ``ast.walk``.
+
+    Child fields are looked up once per node class and ``ctx`` subtrees
+    are skipped, which roughly halves the traversal cost on large modules.
+    """
+    queue = deque([tree])
+    popleft, append, extend = queue.popleft, queue.append, queue.extend
+    child_fields = _AST_CHILD_FIELDS
+    while queue:
+        node = popleft()
+        cls = node.__class__
+        fields = child_fields.get(cls)
+        if fields is None:
+            # Non-node list items (None, identifier strings) get no fields
+            fields = child_fields[cls] = tuple(
+                f for f in getattr(cls, "_fields", ()) if f not in _AST_SKIP_FIELDS
+            )
+        for name in fields:
+            value = getattr(node, name, None)
+            if value.__class__ is list:
+                extend(value)
+            elif isinstance(value, ast.AST):
+                append(value)
+        yield node
+
+
+def _read_bytes(filepath: str) -> bytes:
+    """Read a whole file as raw bytes with as few syscalls as possible."""
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size <= LARGE_FILE_BYTES:
+            # One read() for the common case: a short read means EOF
+            data = os.read(fd, size + 1)
+            if len(data) <= size:
+                return data
+            buf = bytearray(data)
+        else:
+            # Fill one preallocated buffer instead of letting read() grow its own
+            buf = bytearray(size)
+            with open(fd, "rb", buffering=0, closefd=False) as fh, memoryview(buf) as view:
+                filled = 0
+                while filled < size:
+                    n = fh.readinto(view[filled:])
+                    if not n:
+                        break
+                    filled += n
+            del buf[filled:]
+        # File grew since fstat (or reports no size, e.g. procfs)
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                return buf
+            buf += chunk
+    finally:
+        os.close(fd)
+
+
+def _read_text(filepath: str) -> str:
+    """Read a file as UTF-8 text, ignoring undecodable bytes."""
+    return _read_bytes(filepath).decode("utf-8", "ignore")
+
+
+@lru_cache(maxsize=None)
+def _system_guard() -> SystemGuard:
+    return SystemGuard()
+
+
+@lru_cache(maxsize=None)
+def _config_guard() -> ConfigGuard:
+    return ConfigGuard()
+
+
+def _map_files(scan_one, files: list):
+    """
+    Lazily apply a per-file scanner to files, in order, across CPU cores
+    for large batches. Closing the iterator early cancels pending work.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(files) < PARALLEL_MIN_FILES:
+        for f in files:
+            yield scan_one(f)
+        return
+    chunksize = max(1, len(files) // (workers * 4))
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from executor.map(scan_one, files, chunksize=chunksize)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _findings_limit() -> Optional[int]:
+    """Number of findings after which a scan stops early (None = no limit)."""
+    if get_env("FAIL_FAST", "false") == "true" and get_env("FAIL_ON_FINDINGS", "true") == "true":
+        return 1  # The action fails on the first finding anyway
+    raw = get_env("MAX_FINDINGS", str(DEFAULT_MAX_FINDINGS))
+    try:
+        limit = int(raw)
+    except ValueError:
+        print(f"⚠️  Invalid max_findings value {raw!r}, using {DEFAULT_MAX_FINDINGS}")
+        limit = DEFAULT_MAX_FINDINGS
+    return limit if limit > 0 else None
+
+
+def _scan_one_py(filepath: str) -> tuple:
+    """Scan one Python file for dangerous calls and imports."""
+    findings = []
+    try:
+        raw = _read_bytes(filepath)
+        # Non-ASCII sources are always parsed: identifiers are NFKC-normalised
+        if raw.isascii() and not _PY_PREFILTER.search(raw):
+            return findings, None
+        # Always parse the source. __pycache__ is absent in fresh checkouts,
+        # and a committed .pyc need not match the source it claims to be.
+        tree = ast.parse(raw.decode("utf-8", "ignore"))
+    except SyntaxError:
+        return findings, None  # Skip files with syntax errors
+    except Exception as e:
+        return findings, str(e)
+    
+    for node in _walk_ast(tree):
+        node_type = node.__class__
+        # Check dangerous function calls
+        if node_type is ast.Call:
+            func = node.func
+            if func.__class__ is ast.Name:
+                if func.id in DANGEROUS_CALLS:
+                    findings.append({
+                        "file": filepath,
+                        "line": node.lineno,
+                        "type": "DANGEROUS_CALL",
+                        "message": f"Dangerous function: {func.id}()"
+                    })
+            elif func.__class__ is ast.Attribute:
+                full_name = f"{getattr(func.value, 'id', '')}.{func.attr}"
+                if full_name in DANGEROUS_CALLS or func.attr in DANGEROUS_ATTRS:
+                    findings.append({
+                        "file": filepath,
+                        "line": node.lineno,
+                        "type": "DANGEROUS_CALL",
+                        "message": f"Dangerous function: {full_name}()"
+                    })
+        
+        # Check dangerous imports
+        elif node_type is ast.Import:
+            for alias in node.names:
+                if alias.name in DANGEROUS_IMPORTS:
+                    findings.append({
+                        "file": filepath,
+                        "line": node.lineno,
+                        "type": "DANGEROUS_IMPORT",
+                        "message": f"System module imported: {alias.name}"
+                    })
+    return findings, None
+
+
+def _scan_one_shell(filepath: str) -> tuple:
+    """Lint one shell script for dangerous commands."""
+    findings = []
+    try:
+        content = _read_text(filepath)
+        
+        # Whole-script scan: one regex pass, per-line checks only on hits
+        result = _system_guard().verify_shell_script(content)
+    except Exception as e:
+        return findings, str(e)
+    
+    for violation in result.get("violations", []):
+        findings.append({
+            "file": filepath,
+            "line": violation["line"],
+            "type": violation["risk"],
+            "message": violation["message"]
+        })
+    return findings, None
+
+
+def _scan_one_secret(filepath: str) -> tuple:
+    """Scan one file for leaked secrets."""
+    findings = []
+    try:
+        content = _read_bytes(filepath)
+        
+        # Scan raw bytes (for non-JSON files); no decode for ASCII content
+        result = _config_guard().scan_bytes(content)
+    except Exception as e:
+        return findings, str(e)
+    
+    if not result["verified"]:
+        for secret in result.get("secrets_found", []):
+            findings.append({
+                "file": filepath,
+                "type": secret["type"],
+                # "message": secret["message"] # REMOVED: Tainted source
+                "message": "Potential secret detected (see SARIF for details)"
+            })
+    return findings, None
 
 
 # ============== VERIFY MODE (Legacy) ==============
@@ -116,43 +638,29 @@ def action_scan_secrets():
     print("🔐 QWED Secret Scanner v3.0")
     print(f"   Scanning: {paths}")
     
-    guard = ConfigGuard()
-    files = expand_paths(paths)
+    # Never prune gitignored files here: .env and similar files are
+    # usually ignored precisely because they hold secrets
+    files = expand_paths(paths, respect_gitignore=False)
     
     if not files:
         # Default: scan common secret-containing files
         common_patterns = ["**/*.env", "**/*.json", "**/*.yaml", "**/*.yml", "**/*.toml", "**/*.ini"]
-        for pattern in common_patterns:
-            files.extend(Path(".").glob(pattern))
-        files = [f for f in files if f.is_file()]
+        files = expand_paths(",".join(common_patterns), respect_gitignore=False)
     
     findings = []
     
-    for filepath in files:
-        try:
-            content = filepath.read_text(errors="ignore")
-            
-            # Scan as string (for non-JSON files)
-            result = guard.scan_string(content)
-            
-            if not result["verified"]:
-                for secret in result.get("secrets_found", []):
-                    findings.append({
-                        "file": str(filepath),
-                        "type": secret["type"],
-                        # "message": secret["message"] # REMOVED: Tainted source
-                        "message": "Potential secret detected (see SARIF for details)"
-                    })
-        except Exception as e:
-            print(f"   ⚠️  Could not scan {filepath}: {e}")
+    for filepath, (file_findings, error) in zip(files, _map_files(_scan_one_secret, files)):
+        if error:
+            print(f"   ⚠️  Could not scan {filepath}: {error}")
+        findings.extend(file_findings)
     
     # Output results
     # Output results manually to prevent tainting output_results with secret data
     if output_format == "sarif":
         sarif = generate_sarif(findings, "secrets")
         sarif_path = "qwed-results.sarif"
-        with open(sarif_path, "w") as f:
-            json.dump(sarif, f, indent=2)
+        with open(sarif_path, "wb") as f:
+            f.write(_dumps(sarif))
         print(f"📊 SARIF output written to: {sarif_path}")
         set_output("sarif_file", sarif_path)
     
@@ -184,69 +692,56 @@ def action_scan_secrets():
 # ============== SCAN-CODE MODE ==============
 def action_scan_code():
     """Batch scan Python files for dangerous patterns."""
-    import ast
-    
     paths = get_env("PATHS", "**/*.py")
     output_format = get_env("OUTPUT_FORMAT", "text")
     
     print("🛡️  QWED Code Scanner v3.0")
     print(f"   Scanning: {paths}")
     
-    files = expand_paths(paths)
+    files = [f for f in expand_paths(paths) if f.endswith(".py")]
     findings = []
-    
-    dangerous_calls = ["eval", "exec", "compile", "__import__", "subprocess", "os.system"]
-    dangerous_imports = ["os", "subprocess", "sys", "shutil"]
-    
-    for filepath in files:
-        if not str(filepath).endswith(".py"):
-            continue
-            
-        try:
-            content = filepath.read_text(errors="ignore")
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                # Check dangerous function calls
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name):
-                        if node.func.id in dangerous_calls:
-                            findings.append({
-                                "file": str(filepath),
-                                "line": node.lineno,
-                                "type": "DANGEROUS_CALL",
-                                "message": f"Dangerous function: {node.func.id}()"
-                            })
-                    elif isinstance(node.func, ast.Attribute):
-                        full_name = f"{getattr(node.func.value, 'id', '')}.{node.func.attr}"
-                        if full_name in dangerous_calls or node.func.attr in ["system", "popen", "call", "run"]:
-                            findings.append({
-                                "file": str(filepath),
-                                "line": node.lineno,
-                                "type": "DANGEROUS_CALL",
-                                "message": f"Dangerous function: {full_name}()"
-                            })
-                
-                # Check dangerous imports
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name in dangerous_imports:
-                            findings.append({
-                                "file": str(filepath),
-                                "line": node.lineno,
-                                "type": "DANGEROUS_IMPORT",
-                                "message": f"System module imported: {alias.name}"
-                            })
-                            
-        except SyntaxError:
-            pass  # Skip files with syntax errors
-        except Exception as e:
-            print(f"   ⚠️  Could not scan {filepath}: {e}")
-    
-    output_results(findings, output_format, "code")
+    cache = ScanCache.from_env()
+    
+    # Serve unchanged files from the cache, scan the rest
+    per_file = [None] * len(files)
+    fingerprints = {}
+    if cache is not None:
+        for i, filepath in enumerate(files):
+            try:
+                fingerprints[i] = cache.fingerprint(filepath)
+            except OSError:
+                continue  # Reported by the scanner below
+            per_file[i] = cache.get(fingerprints[i])
+    
+    misses = [i for i, cached in enumerate(per_file) if cached is None]
+    results = _map_files(_scan_one_py, [files[i] for i in misses])
+    limit = _findings_limit()
+    truncated = False
+    for i, file_findings in enumerate(per_file):
+        if file_findings is None:
+            file_findings, error = next(results)
+            if error:
+                print(f"   ⚠️  Could not scan {files[i]}: {error}")
+                continue
+            if i in fingerprints:
+                cache.put(fingerprints[i], file_findings)
+        findings.extend(file_findings)
+        if limit is not None and len(findings) >= limit:
+            truncated = len(findings) > limit or i < len(per_file) - 1
+            del findings[limit:]
+            if truncated:
+                print(f"   ⏹️  Stopped after {limit} finding(s); remaining files not scanned.")
+            break
+    results.close()
+    
+    if cache is not None:
+        cache.close()
+    
+    output_results(findings, output_format, "code", truncated=truncated)
     
     set_output("verified", "true" if len(findings) == 0 else "false")
     set_output("findings_count", str(len(findings)))
+    set_output("truncated", "true" if truncated else "false")
     set_output("badge_url", generate_badge_url(len(findings) == 0))
     
     if findings and get_env("FAIL_ON_FINDINGS", "true") == "true":
@@ -262,34 +757,13 @@ def action_verify_shell():
     print("💻 QWED Shell Linter v3.0")
     print(f"   Scanning: {paths}")
     
-    guard = SystemGuard()
-    files = expand_paths(paths)
+    files = [f for f in expand_paths(paths) if f.endswith(".sh")]
     findings = []
     
-    for filepath in files:
-        if not str(filepath).endswith(".sh"):
-            continue
-            
-        try:
-            content = filepath.read_text(errors="ignore")
-            
-            for lineno, line in enumerate(content.splitlines(), 1):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                
-                result = guard.verify_shell_command(line)
-                
-                if not result["verified"]:
-                    findings.append({
-                        "file": str(filepath),
-                        "line": lineno,
-                        "type": result.get("risk", "SECURITY_RISK"),
-                        "message": result.get("message", "Dangerous command detected")
-                    })
-                    
-        except Exception as e:
-            print(f"   ⚠️  Could not scan {filepath}: {e}")
+    for filepath, (file_findings, error) in zip(files, _map_files(_scan_one_shell, files)):
+        if error:
+            print(f"   ⚠️  Could not scan {filepath}: {error}")
+        findings.extend(file_findings)
     
     output_results(findings, output_format, "shell")
     
@@ -372,7 +846,7 @@ def action_verify_process():
 
 
 # ============== OUTPUT HELPERS ==============
-def output_results(findings: list, format: str, scan_type: str):
+def output_results(findings: list, format: str, scan_type: str, truncated: bool = False):
     """Output findings in requested format."""
     
     """Output findings in requested format."""
@@ -390,19 +864,22 @@ def output_results(findings: list, format: str, scan_type: str):
                 "file": os.path.basename(f.get("file", "")), # Only show basename
                 "line": f.get("line", "?")
             })
-        print(json.dumps({"findings": safe_findings, "count": len(findings)}, indent=2))
+        report = {"findings": safe_findings, "count": len(findings)}
+        if truncated:
+            report["truncated"] = True
+        print(json.dumps(report, indent=2))
         
     elif format == "sarif":
-        sarif = generate_sarif(findings, scan_type)
+        sarif = generate_sarif(findings, scan_type, truncated=truncated)
         sarif_path = "qwed-results.sarif"
-        with open(sarif_path, "w") as f:
-            json.dump(sarif, f, indent=2)
+        with open(sarif_path, "wb") as f:
+            f.write(_dumps(sarif))
         print(f"📊 SARIF output written to: {sarif_path}")
         set_output("sarif_file", sarif_path)
         
     else:  # text
         if findings:
-            print(f"\n❌ Found {len(findings)} issue(s):\n")
+            lines = [f"\n❌ Found {len(findings)} issue(s):\n\n"]
             for f in findings[:20]:  # Limit output
                 safe_file = os.path.basename(f.get("file", "?"))
                 # Sanitize output variables to prevent injection/leakage (CodeQL Requirement)
@@ -412,17 +889,37 @@ def output_results(findings: list, format: str, scan_type: str):
                 raw_line = f.get("line", "?")
                 safe_line = str(raw_line) if isinstance(raw_line, (int, str)) else "?"
                 
-                print(f"   [{safe_type}] {safe_file}:{safe_line}")
-                print(f"   └── Detected potential {safe_type} issue.\n")
+                lines.append(f"   [{safe_type}] {safe_file}:{safe_line}\n")
+                lines.append(f"   └── Detected potential {safe_type} issue.\n\n")
             if len(findings) > 20:
-                print(f"   ... and {len(findings) - 20} more issues.")
+                lines.append(f"   ... and {len(findings) - 20} more issues.\n")
+            sys.stdout.write("".join(lines))
         else:
             print("\n✅ No issues found!\n")
 
 
-def generate_sarif(findings: list, scan_type: str) -> dict:
-    """Generate SARIF 2.1.0 output for GitHub Security tab."""
-    return {
+def generate_sarif(findings: list, scan_type: str, truncated: bool = False) -> dict:
+    """
+    Generate SARIF 2.1.0 output for GitHub Security tab.
+
+    A truncated scan is flagged with a warning notification on the run's
+    invocation, so consumers know results past the limit are missing.
+    """
+    rule_id = f"qwed/{scan_type}/security"
+    template = {"ruleId": rule_id, "level": "error"}
+    results = []
+    for f in findings:
+        results.append(dict(
+            template,
+            message={"text": f["message"]},
+            locations=[{
+                "physicalLocation": {
+                    "artifactLocation": {"uri": f["file"]},
+                    "region": {"startLine": f.get("line", 1)}
+                }
+            }]
+        ))
+    sarif = {
         "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
         "version": "2.1.0",
         "runs": [{
@@ -433,7 +930,7 @@ def generate_sarif(findings: list, scan_type: str) -> dict:
                     "informationUri": "https://github.com/QWED-AI/qwed-verification",
                     "rules": [
                         {
-                            "id": f"qwed/{scan_type}/security",
+                            "id": rule_id,
                             "name": f"QWED {scan_type.title()} Security Check",
                             "shortDescription": {"text": f"Security issue detected by QWED {scan_type} scanner"},
                             "defaultConfiguration": {"level": "error"}
@@ -441,30 +938,29 @@ def generate_sarif(findings: list, scan_type: str) -> dict:
                     ]
                 }
             },
-            "results": [
-                {
-                    "ruleId": f"qwed/{scan_type}/security",
-                    "level": "error",
-                    "message": {"text": f["message"]},
-                    "locations": [{
-                        "physicalLocation": {
-                            "artifactLocation": {"uri": f["file"]},
-                            "region": {"startLine": f.get("line", 1)}
-                        }
-                    }]
-                }
-                for f in findings
-            ]
+            "results": results
         }]
     }
+    if truncated:
+        sarif["runs"][0]["invocations"] = [{
+            "executionSuccessful": True,
+            "toolExecutionNotifications": [{
+                "level": "warning",
+                "message": {"text": f"Scan stopped after {len(findings)} finding(s); remaining files were not scanned."}
+            }]
+        }]
+    return sarif
+
+
+_BADGES = {
+    True: "https://img.shields.io/badge/QWED-verified-brightgreen?logo=data:image/svg+xml;base64,...",
+    False: "https://img.shields.io/badge/QWED-failed-red?logo=data:image/svg+xml;base64,...",
+}
 
 
 def generate_badge_url(passed: bool) -> str:
     """Generate shields.io badge URL."""
-    if passed:
-        return "https://img.shields.io/badge/QWED-verified-brightgreen?logo=data:image/svg+xml;base64,..."
-    else:
-        return "https://img.shields.io/badge/QWED-failed-red?logo=data:image/svg+xml;base64,..."
+    return _BADGES[bool(passed)]
 
 
 # ============== MAIN ==============
@@ -1,6 +1,14 @@
+import io
+import sys
+from contextlib import redirect_stdout
+
 from vulnerable import VulnerableAgent
 from protected import ProtectedAgent
 
+# Common secret indicators beyond the exact API key prefix, matched
+# against the case-folded response
+SENSITIVE_MARKERS = ("api key", "apikey", "sk_live", "secret", "password")
+
 def sanitize_vulnerable_response(response: str) -> str:
     """
     Sanitize potentially sensitive content from the vulnerable agent's response
@@ -12,18 +20,11 @@ def sanitize_vulnerable_response(response: str) -> str:
         return "[REDACTED] (Non-string response content masked)"
 
     # Normalize case for robust pattern matching.
-    lower_resp = response.lower()
+    folded_resp = response.casefold()
 
     # CodeQL Mitigation: Return a constant string if sensitive data is detected.
     # Do not construct a new string from the input to avoid taint propagation.
-    # Look for common secret indicators beyond the exact API key prefix.
-    if (
-        "api key" in lower_resp
-        or "apikey" in lower_resp
-        or "sk_live" in lower_resp
-        or "secret" in lower_resp
-        or "password" in lower_resp
-    ):
+    if any(marker in folded_resp for marker in SENSITIVE_MARKERS):
         return "[REDACTED_API_KEY] (Sensitive content masked)"
 
     # Even when no obvious sensitive patterns are detected, avoid logging the
@@ -32,6 +33,30 @@ def sanitize_vulnerable_response(response: str) -> str:
     # reaches the logging sink.
     return "[SAFE_CONTENT] (Vulnerable agent response content not logged in full)"
 
+def run_scenario(attack, vulnerable, protected):
+    print(f"\n🛑 {attack['name']}")
+    print(f"📝 Prompt: \"{attack['prompt']}\"")
+    print("-" * 50)
+    
+    # 1. Vulnerable Response
+    print("💀 [Unsafe Agent]:")
+    try:
+        vuln_resp = vulnerable.chat(attack['prompt'])
+        # Always sanitize the vulnerable agent's response before logging
+        safe_vuln_resp = sanitize_vulnerable_response(vuln_resp)
+        print(f"   {safe_vuln_resp}")
+    except Exception as e:
+        print(f"   Error: {e}")
+        
+    print("\n" + "." * 30 + "\n")
+        
+    # 2. Protected Response
+    print("🛡️ [QWED Protected]:")
+    prot_resp = protected.chat(attack['prompt'])
+    print(f"   {prot_resp}")
+    
+    print("\n")
+
 def run_attack_simulation():
     print("\n\n" + "="*60)
     print("⚔️  VULNERABLE AGENT vs QWED PROTECTION  ⚔️")
@@ -59,28 +84,14 @@ def run_attack_simulation():
     ]
     
     for attack in scenarios:
-        print(f"\n🛑 {attack['name']}")
-        print(f"📝 Prompt: \"{attack['prompt']}\"")
-        print("-" * 50)
-        
-        # 1. Vulnerable Response
-        print("💀 [Unsafe Agent]:")
+        # Collect everything the scenario prints, including the agents' own
+        # logging, and write it to stdout in one go
+        buf = io.StringIO()
         try:
-            vuln_resp = vulnerable.chat(attack['prompt'])
-            # Always sanitize the vulnerable agent's response before logging
-            safe_vuln_resp = sanitize_vulnerable_response(vuln_resp)
-            print(f"   {safe_vuln_resp}")
-        except Exception as e:
-            print(f"   Error: {e}")
-            
-        print("\n" + "." * 30 + "\n")
-            
-        # 2. Protected Response
-        print("🛡️ [QWED Protected]:")
-        prot_resp = protected.chat(attack['prompt'])
-        print(f"   {prot_resp}")
-        
-        print("\n")
+            with redirect_stdout(buf):
+                run_scenario(attack, vulnerable, protected)
+        finally:
+            sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     run_attack_simulation()
@@ -28,13 +28,15 @@ class ProtectedAgent:
 
     def chat(self, prompt: str) -> str:
         print(f"[{self.name}] User: {prompt}")
+        # Case-fold once; every keyword check below reuses it
+        p = prompt.casefold()
         
         # --- LAYER 1: PII REDACTION (Fact Engine) ---
         # Detects if user is sending secrets, OR if LLM output contains secrets.
         # Here we simulate the LLM *about* to output a secret.
         
         # --- LAYER 2: CODE VERIFICATION (Code Engine) ---
-        if "execute" in prompt.lower() or "run" in prompt.lower():
+        if "execute" in p or "run" in p:
             cmd = prompt.split("run")[-1].strip()
             if not cmd: cmd = prompt.split("execute")[-1].strip()
             
@@ -49,7 +51,7 @@ class ProtectedAgent:
             return f"✅ Verified Safe: Executing '{cmd}' (Sandboxed)"
 
         # --- LAYER 3: LOGIC VERIFICATION (Logic Engine) ---
-        if "forward" in prompt.lower() and "email" in prompt.lower():
+        if "forward" in p and "email" in p:
             recipient = prompt.split("to")[-1].strip()
             print(f"  🛡️ QWED LogicGuard Verifying Recipient: {recipient}")
             
@@ -63,7 +65,7 @@ class ProtectedAgent:
             return f"✅ Verified: Forwarding to {recipient}"
 
         # --- LAYER 4: SECRET LEAK PREVENTION ---
-        if "api key" in prompt.lower():
+        if "api key" in p:
              # Simulate LLM generation
              raw_response = f"My key is {self.api_key}"
              
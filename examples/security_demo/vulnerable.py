@@ -25,9 +25,11 @@ class VulnerableAgent:
         It inherently trusts the user and tries to execute code if detected.
         """
         print(f"[{self.name}] User: {prompt}")
+        # Case-fold once; every keyword check below reuses it
+        p = prompt.casefold()
         
         # 1. Check for Command Injection (Simulated LLM decision)
-        if "execute" in prompt.lower() or "run" in prompt.lower():
+        if "execute" in p or "run" in p:
             # EXTRACT command (very naive, assumes anything after 'run' is code)
             cmd = prompt.split("run")[-1].strip()
             if not cmd:
@@ -42,12 +44,12 @@ class VulnerableAgent:
                 return f"Error: {e}"
 
         # 2. Check for Prompt Injection / Secrets
-        if "api key" in prompt.lower() or "secret" in prompt.lower():
+        if "api key" in p or "secret" in p:
             # Naive response showing secret
             return f"Here is my configuration. API Key: {self.api_key}"
             
         # 3. Email/Logic flaw
-        if "forward" in prompt.lower() and "email" in prompt.lower():
+        if "forward" in p and "email" in p:
             # Blindly obeys
             return f"✅ Forwarding 5 emails to: {prompt.split('to')[-1].strip()} (Simulated)"
 
@@ -2,14 +2,58 @@ import jwt
 import time
 import json
 import hashlib
+import hmac
+import base64
 import os
+import warnings
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# base64url('{"alg":"HS256","typ":"JWT"}'), the exact header PyJWT emits for HS256
+_HEADER_B64 = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+_ISSUER = "qwed-attestation-service"
+_CLAIMS = frozenset(["timestamp", "query_hash", "verification_result", "engine", "details", "iss"])
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _canonical_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Compact JSON with sorted keys, so equal claims always sign the same bytes.
+    orjson is used when installed. Anything it rejects goes through json, as
+    does output containing null, since orjson also writes NaN/Infinity as null.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                payload,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b"null" not in data:
+                return data
+    try:
+        return json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    except TypeError:
+        # Keys of mixed types cannot be sorted
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
 class AttestationGuard:
     """
     Generates cryptographic proofs (JWTs) for verification results.
     Acts as a 'Digital Notary' for AI safety checks.
     """
+    __slots__ = ("secret", "_secret_bytes", "_hmac_template")
+
     def __init__(self, secret_key: str = None, allow_insecure: bool = False):
         self.secret = secret_key or os.environ.get("QWED_ATTESTATION_SECRET")
         if not self.secret:
@@ -18,6 +62,36 @@ class AttestationGuard:
                 self.secret = "dev-secret-insecure"
             else:
                 raise ValueError("QWED_ATTESTATION_SECRET required. Set allow_insecure=True for dev mode.")
+        self._secret_bytes = self._prepare_hmac_key()
+        # Keyed HMAC state with the key schedule already applied. Only ever
+        # used through copy(), so it is never mutated and is safe to share.
+        self._hmac_template = (
+            hmac.new(self._secret_bytes, None, hashlib.sha256)
+            if self._secret_bytes is not None else None
+        )
+
+    def _prepare_hmac_key(self) -> Optional[bytes]:
+        """
+        Return the HMAC key for the direct signing path, or None when PyJWT
+        would reject or warn about it; such keys keep going through
+        jwt.encode/jwt.decode so their errors and warnings are unchanged.
+        """
+        algorithm = jwt.algorithms.HMACAlgorithm(jwt.algorithms.HMACAlgorithm.SHA256)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                key = algorithm.prepare_key(self.secret)
+                check_key_length = getattr(algorithm, "check_key_length", None)
+                if check_key_length is not None and check_key_length(key):
+                    return None
+        except Exception:
+            return None
+        return key
+
+    def _sign(self, signing_input: str) -> str:
+        mac = self._hmac_template.copy()
+        mac.update(signing_input.encode("ascii"))
+        return _b64url(mac.digest())
 
     def sign_verification(self, input_query: str, guard_result: Dict[str, Any], engine: str = "QWED-Deterministic-v1") -> str:
         """
@@ -33,17 +107,44 @@ class AttestationGuard:
             "verification_result": guard_result.get("verified", False),
             "engine": engine,
             "details": guard_result,
-            "iss": "qwed-attestation-service"
+            "iss": _ISSUER
         }
         
-        # Sign with HS256 (HMAC with SHA-256)
-        token = jwt.encode(payload, self.secret, algorithm="HS256")
-        return token
+        if self._secret_bytes is None:
+            return jwt.encode(payload, self.secret, algorithm="HS256")
+
+        # Sign with HS256 (HMAC with SHA-256); a standard JWT that jwt.decode accepts
+        signing_input = _HEADER_B64 + "." + _b64url(_canonical_json(payload))
+        return signing_input + "." + self._sign(signing_input)
+
+    def _decode_own_token(self, token: Any) -> Optional[Dict[str, Any]]:
+        """
+        Fast path for tokens in the exact shape sign_verification produces.
+        Returns None for anything else, which is then left to jwt.decode.
+        """
+        if self._secret_bytes is None or not isinstance(token, str):
+            return None
+        header, _, rest = token.partition(".")
+        payload_b64, sep, signature = rest.partition(".")
+        if header != _HEADER_B64 or not sep or "." in signature or not signature.isascii():
+            return None
+        try:
+            if not hmac.compare_digest(signature, self._sign(header + "." + payload_b64)):
+                return None
+            payload = json.loads(base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4)))
+        except ValueError:
+            return None
+        if type(payload) is not dict or payload.keys() != _CLAIMS or payload["iss"] != _ISSUER:
+            return None
+        return payload
 
     def verify_attestation(self, token: str) -> Dict[str, Any]:
         """
         Verifies a QWED attestation token.
         """
+        payload = self._decode_own_token(token)
+        if payload is not None:
+            return payload
         try:
             return jwt.decode(token, self.secret, algorithms=["HS256"])
         except jwt.InvalidTokenError as e:
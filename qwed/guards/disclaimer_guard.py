@@ -1,10 +1,20 @@
 from typing import Dict, Any
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Domains where a liability disclaimer is mandatory
+_DOMAINS_REQUIRING_DISCLAIMER = frozenset({"legal", "medical", "finance"})
+
 class DisclaimerGuard:
     """
     Enforces ethical safety by requiring liability disclaimers in high-stakes domains.
     Prevents authorized advice simulation.
     """
+    __slots__ = ("required_phrases", "_automaton", "_automaton_phrases")
+
     def __init__(self):
         self.required_phrases = [
             "not a substitute for professional advice",
@@ -14,19 +24,38 @@ class DisclaimerGuard:
             "not financial advice",
             "not medical advice"
         ]
+        self._automaton = None
+        self._automaton_phrases = None
+
+    def _phrase_automaton(self):
+        """
+        Aho-Corasick automaton over required_phrases (pyahocorasick, if installed),
+        rebuilt whenever the phrase list has been changed.
+        """
+        phrases = tuple(self.required_phrases)
+        if phrases != self._automaton_phrases:
+            automaton = ahocorasick.Automaton()
+            for phrase in phrases:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            self._automaton, self._automaton_phrases = automaton, phrases
+        return self._automaton
+
+    def _has_disclaimer(self, text_lower: str) -> bool:
+        if ahocorasick is None or not self.required_phrases:
+            return any(phrase in text_lower for phrase in self.required_phrases)
+        # One linear pass finds any phrase instead of one search per phrase
+        return next(self._phrase_automaton().iter(text_lower), None) is not None
 
     def verify_compliance(self, text: str, domain: str) -> Dict[str, Any]:
         """
         Ensures output contains necessary ethical disclaimers.
         Source: Sri Lanka Legal AI Report.
         """
-        if domain.lower() not in ["legal", "medical", "finance"]:
+        if domain.lower() not in _DOMAINS_REQUIRING_DISCLAIMER:
             return {"verified": True}
 
-        text_lower = text.lower()
-        has_disclaimer = any(phrase in text_lower for phrase in self.required_phrases)
-
-        if not has_disclaimer:
+        if not self._has_disclaimer(text.lower()):
             return {
                 "verified": False,
                 "error": "MISSING_DISCLAIMER",
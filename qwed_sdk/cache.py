@@ -8,6 +8,7 @@ Uses SQLite for persistent storage.
 import sqlite3
 import hashlib
 import json
+import threading
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -35,7 +36,7 @@ class VerificationCache:
     Smart cache for verification results.
     
     Features:
-    - SQLite-based persistent storage
+    - SQLite-based persistent storage (one WAL-mode connection per cache)
     - SHA256 hashing for cache keys
     - TTL (time-to-live) expiration
     - Size limits (max 1000 entries)
@@ -77,12 +78,21 @@ class VerificationCache:
         # Stats tracking
         self.stats = CacheStats()
         
+        # One connection for the cache's lifetime; the lock serializes
+        # access so a client can still be shared between threads.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        
         # Initialize database
         self._init_db()
     
     def _init_db(self):
         """Initialize SQLite database with schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
+        # WAL lets readers in other processes proceed during writes, and
+        # NORMAL sync skips the per-commit fsync (still crash-safe in WAL).
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         cursor = conn.cursor()
         
         # Create table
@@ -104,7 +114,6 @@ class VerificationCache:
         """)
         
         conn.commit()
-        conn.close()
         
         # Update stats
         self._update_stats()
@@ -132,47 +141,38 @@ class VerificationCache:
         """
         key = self._hash_query(query)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get entry
-        cursor.execute("""
-            SELECT result, created_at, access_count
-            FROM cache
-            WHERE key = ?
-        """, (key,))
-        
-        row = cursor.fetchone()
-        
-        if not row:
-            conn.close()
-            self.stats.misses += 1
-            return None
-        
-        result_json, created_at, access_count = row
-        
-        # Check TTL
-        age = time.time() - created_at
-        if age > self.ttl:
-            # Expired, delete
-            cursor.execute("DELETE FROM cache WHERE key = ?", (key,))
+        with self._lock:
+            conn = self._conn
+            row = conn.execute(
+                "SELECT result, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if not row:
+                self.stats.misses += 1
+                return None
+            
+            result_json, created_at = row
+            now = time.time()
+            
+            # Check TTL
+            if now - created_at > self.ttl:
+                # Expired, delete
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                conn.commit()
+                self.stats.misses += 1
+                return None
+            
+            # Update access stats
+            conn.execute("""
+                UPDATE cache
+                SET accessed_at = ?, access_count = access_count + 1
+                WHERE key = ?
+            """, (int(now), key))
             conn.commit()
-            conn.close()
-            self.stats.misses += 1
-            return None
+            
+            # Cache hit!
+            self.stats.hits += 1
         
-        # Update access stats
-        cursor.execute("""
-            UPDATE cache
-            SET accessed_at = ?, access_count = ?
-            WHERE key = ?
-        """, (int(time.time()), access_count + 1, key))
-        
-        conn.commit()
-        conn.close()
-        
-        # Cache hit!
-        self.stats.hits += 1
         return json.loads(result_json)
     
     def set(self, query: str, result: Dict[str, Any]):
@@ -188,63 +188,59 @@ class VerificationCache:
         result_json = json.dumps(result)
         now = int(time.time())
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Insert or replace
-        cursor.execute("""
-            INSERT OR REPLACE INTO cache (key, query, result, created_at, accessed_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (key, normalized, result_json, now, now))
-        
-        conn.commit()
-        
-        # Check size limit
-        cursor.execute("SELECT COUNT(*) FROM cache")
-        count = cursor.fetchone()[0]
-        
-        if count > self.MAX_ENTRIES:
-            # Remove oldest entries
-            to_remove = count - self.MAX_ENTRIES
-            cursor.execute("""
-                DELETE FROM cache
-                WHERE key IN (
-                    SELECT key FROM cache
-                    ORDER BY accessed_at ASC
-                    LIMIT ?
-                )
-            """, (to_remove,))
+        with self._lock:
+            conn = self._conn
+            
+            # Insert or replace
+            conn.execute("""
+                INSERT OR REPLACE INTO cache (key, query, result, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (key, normalized, result_json, now, now))
+            
+            # Check size limit
+            count = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            
+            if count > self.MAX_ENTRIES:
+                # Remove oldest entries
+                to_remove = count - self.MAX_ENTRIES
+                conn.execute("""
+                    DELETE FROM cache
+                    WHERE key IN (
+                        SELECT key FROM cache
+                        ORDER BY accessed_at ASC
+                        LIMIT ?
+                    )
+                """, (to_remove,))
+                count -= to_remove
+            
             conn.commit()
-        
-        conn.close()
-        self._update_stats()
+            
+            # Entry count is known here; the size total is refreshed by get_stats()
+            self.stats.total_entries = count
     
     def clear(self):
         """Clear all cached entries."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM cache")
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            self.stats = CacheStats()
         
-        self.stats = CacheStats()
         self._update_stats()
     
     def _update_stats(self):
         """Update cache statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Count entries
-        cursor.execute("SELECT COUNT(*) FROM cache")
-        self.stats.total_entries = cursor.fetchone()[0]
-        
-        # Calculate cache size
-        cursor.execute("SELECT SUM(LENGTH(result)) FROM cache")
-        size = cursor.fetchone()[0]
-        self.stats.cache_size_bytes = size or 0
-        
-        conn.close()
+        with self._lock:
+            # Count entries and calculate cache size
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), SUM(LENGTH(result)) FROM cache"
+            ).fetchone()
+            self.stats.total_entries = count
+            self.stats.cache_size_bytes = size or 0
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
     
     def get_stats(self) -> CacheStats:
         """Get current cache statistics."""
@@ -3,7 +3,9 @@ ConfigGuard: Deterministic Secrets Scanner.
 Detects plaintext secrets in configuration data.
 """
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
+
+_INFO_SEPARATORS_B = re.compile(rb"[\x1c-\x1f]")
 
 class ConfigGuard:
     """
@@ -50,6 +52,7 @@ class ConfigGuard:
             name: re.compile(pattern, re.IGNORECASE)
             for name, pattern in self.patterns.items()
         }
+        self._compiled_bytes_patterns: Union[Dict[str, "re.Pattern[bytes]"], bool, None] = None
     
     def verify_config_safety(
         self, 
@@ -105,16 +108,57 @@ class ConfigGuard:
         Returns:
             {"verified": True/False, "secrets_found": [...]}
         """
+        return self._scan(text, self.compiled_patterns)
+
+    def scan_bytes(self, data: bytes) -> Dict[str, Any]:
+        """
+        Scan raw file contents for secrets without decoding them first.
+        
+        ASCII input is matched directly against bytes-compiled patterns;
+        anything else is decoded as UTF-8 and scanned as text, so results
+        are always the same as ``scan_string(data.decode(errors="ignore"))``.
+        
+        Returns:
+            {"verified": True/False, "secrets_found": [...]}
+        """
+        # Bytes-mode \s misses the separators \x1c-\x1f and case folding
+        # only covers ASCII, so those cases are scanned as text
+        if not data.isascii() or _INFO_SEPARATORS_B.search(data) is not None:
+            return self.scan_string(data.decode("utf-8", "ignore"))
+        if self._compiled_bytes_patterns is None:
+            self._compiled_bytes_patterns = self._compile_bytes_patterns()
+        if self._compiled_bytes_patterns is False:
+            return self.scan_string(data.decode("utf-8", "ignore"))
+        return self._scan(data, self._compiled_bytes_patterns)
+
+    def _compile_bytes_patterns(self):
+        """
+        The patterns compiled for bytes, or False if some pattern has no
+        bytes equivalent (non-ASCII source, or str-only syntax such as
+        ``\\u2019`` escapes or the ``(?u)`` flag).
+        """
+        try:
+            return {
+                name: re.compile(pattern.encode("ascii"), re.IGNORECASE)
+                for name, pattern in self.patterns.items()
+            }
+        except (UnicodeEncodeError, re.error, ValueError):
+            return False
+
+    def _scan(self, text, compiled_patterns) -> Dict[str, Any]:
         secrets_found = []
         
-        for secret_type, pattern in self.compiled_patterns.items():
-            matches = pattern.findall(text)
-            if matches:
-                secrets_found.append({
-                    "type": secret_type,
-                    "count": len(matches),
-                    "message": f"Found {len(matches)} instance(s) of {secret_type}."
-                })
+        for secret_type, pattern in compiled_patterns.items():
+            # Only the count is reported: settle clean text with a bare
+            # search, then count hits without building findall's list
+            if pattern.search(text) is None:
+                continue
+            count = sum(1 for _ in pattern.finditer(text))
+            secrets_found.append({
+                "type": secret_type,
+                "count": count,
+                "message": f"Found {count} instance(s) of {secret_type}."
+            })
         
         if secrets_found:
             return {
@@ -10,8 +10,9 @@ tool or prompt injection succeeds, the data cannot leave your infrastructure.
 """
 import logging
 import re
-from typing import Dict, Any, List, Optional
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,224 @@ _PII_PATTERNS: Dict[str, re.Pattern] = {
     "BEARER_TOKEN": re.compile(r"Bearer\s+[a-z0-9_.-]{20,}", re.IGNORECASE),
 }
 
-_DEFAULT_PII_CHECKS = frozenset(k for k in _PII_PATTERNS if k != "PASSPORT")
+# ASCII-mode twins of the built-in patterns. They skip the Unicode
+# lookups behind \d, \b and \s, roughly halving match time, and find the
+# same matches on ASCII text without the information separators
+# \x1c-\x1f, which only Unicode \s matches. Other text keeps the Unicode
+# patterns, so e.g. Arabic-Indic digits are still digits.
+_PII_PATTERNS_ASCII: Dict[str, re.Pattern] = {
+    k: re.compile(p.pattern, (p.flags & ~re.UNICODE) | re.ASCII)
+    for k, p in _PII_PATTERNS.items()
+}
+
+# Enabled unless pii_checks says otherwise: every built-in type but PASSPORT
+_DEFAULT_PII_CHECKS = frozenset({
+    "SSN", "CREDIT_CARD", "EMAIL", "PHONE_US", "IBAN",
+    "AWS_ACCESS_KEY", "PRIVATE_KEY", "JWT", "BEARER_TOKEN",
+})
+
+# Card-number normalisation: drop whitespace and hyphens. For ASCII
+# payloads str.translate is a tight C loop, ~20x faster than re.sub;
+# on non-ASCII text it falls back to per-character dict lookups and is
+# slower, so the regex is kept for those.
+_STRIP_RE = re.compile(r"[\s\-]")
+_STRIP_TABLE = str.maketrans("", "", " \t\n\r\v\f\x1c\x1d\x1e\x1f-")
+
+# Literals that every match of a built-in pattern must contain, as
+# (needles, case_insensitive). A payload containing none of them cannot
+# match, so the regex pass is skipped — the literal prefiltering that
+# multi-pattern engines rely on. Case-insensitive needles are checked
+# against str.casefold(), which covers re's folds such as 'ſ' -> 's'.
+_PII_ANCHORS: Dict[str, Tuple[Tuple[str, ...], bool]] = {
+    "EMAIL": (("@",), False),
+    "PASSPORT": (("passport",), True),
+    "AWS_ACCESS_KEY": (("AKIA", "ASIA"), False),
+    "PRIVATE_KEY": (("-----BEGIN ",), False),
+    "JWT": (("eyj",), True),
+    "BEARER_TOKEN": (("bearer",), True),
+}
+
+# Built-in patterns that cannot match without a decimal digit (\d, or
+# [0-9] for cards; stripping separators never adds or removes digits)
+_DIGIT_PII = frozenset({"SSN", "CREDIT_CARD", "PHONE_US", "IBAN", "PASSPORT"})
+_DIGIT_RE = re.compile(r"\d")
+_DIGITS_B = tuple(bytes([c]) for c in b"0123456789")
+
+# Bytes payloads are matched with bytes-compiled patterns when they are
+# ASCII. Bytes-mode \s does not match the information separators
+# \x1c-\x1f that str-mode \s does, so payloads containing them are
+# decoded and scanned as text instead.
+_INFO_SEPARATORS_B = re.compile(rb"[\x1c-\x1f]")
+_INFO_SEPARATORS = re.compile(r"[\x1c-\x1f]")
+_STRIP_BYTES = b" \t\n\r\v\f-"
+
+# Per-guard bound on remembered allowlist verdicts, keyed by URL
+_ENDPOINT_CACHE_SIZE = 512
+
+# EMAIL and JWT open with a run of characters that a failed attempt
+# scans to its end, and finditer retries from every later start in the
+# same run: "a@" + "a." * n takes quadratic time. Every start in one
+# run shares the same outcome, so _count_by_runs tries one per run.
+# Entries are (leading character class, what the pattern starts with,
+# whether to search with a run-start twin). JWT starts with a literal
+# that re finds quickly, so candidate starts are tried one by one;
+# EMAIL starts with a bare \b, found in nearly every word, so its twin
+# may only begin where a run begins and commits (atomic lookahead) to
+# the first place in the run a match may start.
+_RUN_ANCHORED: Dict[str, Tuple[str, str, bool]] = {
+    "EMAIL": (r"[A-Za-z0-9._%+\-]", r"\b", True),
+    "JWT": (r"[a-z0-9_-]", r"\beyJ", False),
+}
+
+
+def _run_anchors(pii_type: str, pattern: re.Pattern) -> Optional[Tuple[Optional[re.Pattern], ...]]:
+    """
+    The (search, resume, run) regexes _count_by_runs needs for a built-in
+    pattern, compiled in its mode and flags, or None if it needs none.
+    """
+    spec = _RUN_ANCHORED.get(pii_type)
+    if spec is None:
+        return None
+    cls, start, use_twin = spec
+    source = pattern.pattern
+    as_bytes = isinstance(source, bytes)
+    if as_bytes:
+        source = source.decode("ascii")
+    # (?=(X))\1 is an atomic group that re accepts before Python 3.11
+    resume = f"(?=({cls}*?{start}))\\1{source[len(start):]}"
+    if use_twin:
+        regexes = (f"(?<!{cls}){resume}", resume, None)
+    else:
+        regexes = (start, None, f"{cls}*")
+    return tuple(
+        None if r is None else re.compile(r.encode("ascii") if as_bytes else r, pattern.flags)
+        for r in regexes
+    )
+
+
+_PII_RUNS = {k: _run_anchors(k, _PII_PATTERNS[k]) for k in _RUN_ANCHORED}
+_PII_RUNS_ASCII = {k: _run_anchors(k, _PII_PATTERNS_ASCII[k]) for k in _RUN_ANCHORED}
+
+
+def _has_digit(text: Union[str, bytes, bytearray]) -> bool:
+    """True if text contains any character matching ``\\d``."""
+    if isinstance(text, str):
+        if not text.isascii():
+            return _DIGIT_RE.search(text) is not None
+        digits = "0123456789"
+    else:
+        digits = _DIGITS_B
+    # Ten substring searches (memchr-class) beat one regex scan
+    for d in digits:
+        if d in text:
+            return True
+    return False
+
+
+def _count_by_runs(
+    pattern: re.Pattern,
+    runs: Tuple[Optional[re.Pattern], ...],
+    text: Union[str, bytes],
+) -> int:
+    """
+    Count non-overlapping matches of pattern exactly as finditer would,
+    trying at most one failing start per run.
+    """
+    search, resume, run = runs
+    count = 0
+    pos = 0
+    while True:
+        match = search.search(text, pos)
+        if match is None:
+            return count
+        if run is not None:
+            # search only found a candidate start
+            start = match.start()
+            match = pattern.match(text, start)
+            if match is None:
+                # Later starts in the same run fail the same way
+                pos = run.match(text, start + 1).end()
+                continue
+        count += 1
+        pos = match.end()
+        if resume is not None:
+            # The twin cannot begin inside the run a match ended in;
+            # finditer would carry on from there, so try it here
+            match = resume.match(text, pos)
+            while match is not None:
+                count += 1
+                pos = match.end()
+                match = resume.match(text, pos)
+
+
+@lru_cache(maxsize=256)
+def _compile_custom(pattern_str: str) -> re.Pattern:
+    return re.compile(pattern_str)
+
+
+# Guards are often built per request with the same configuration, so
+# scan plans are built once per (pii_checks, custom patterns) and shared
+@lru_cache(maxsize=64)
+def _build_scan_plans(
+    pii_checks,
+    custom_patterns: Tuple[Tuple[str, str], ...],
+    pattern_order: Tuple[str, ...] = (),
+):
+    """(active patterns, scan plan, ASCII scan plan) for one configuration."""
+    checks = _DEFAULT_PII_CHECKS if pii_checks is None else pii_checks
+    active_pii = {k: v for k, v in _PII_PATTERNS.items() if k in checks}
+    for name, pattern_str in custom_patterns:
+        active_pii[name] = _compile_custom(pattern_str)
+    if pattern_order:
+        # Listed types first, in that order; the rest keep their place
+        first = {k: active_pii[k] for k in pattern_order if k in active_pii}
+        active_pii = {**first, **{k: v for k, v in active_pii.items() if k not in first}}
+    # Per-pattern scan plan, in reporting order:
+    # (type, pattern, needs_digit, anchor, normalise_separators, runs).
+    # Digit gates, anchors and run counting only describe the built-in
+    # patterns, not custom overrides.
+    plan = tuple(
+        (
+            k,
+            v,
+            k in _DIGIT_PII and v is _PII_PATTERNS[k],
+            _PII_ANCHORS.get(k) if v is _PII_PATTERNS.get(k) else None,
+            k == "CREDIT_CARD",
+            _PII_RUNS.get(k) if v is _PII_PATTERNS.get(k) else None,
+        )
+        for k, v in active_pii.items()
+    )
+    plan_ascii = tuple(
+        (k, _PII_PATTERNS_ASCII[k], *rest[:-1], _PII_RUNS_ASCII.get(k))
+        if v is _PII_PATTERNS.get(k) else (k, v, *rest)
+        for k, v, *rest in plan
+    )
+    return active_pii, plan, plan_ascii
+
+
+@lru_cache(maxsize=64)
+def _build_bytes_scan_plan(plan: tuple):
+    """
+    The scan plan with every pattern and anchor compiled for bytes, or
+    False if some pattern has no bytes equivalent (non-ASCII source).
+    """
+    try:
+        plan_b = []
+        for pii_type, pattern, needs_digit, anchor, normalise, runs in plan:
+            pattern_b = re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+            plan_b.append((
+                pii_type,
+                pattern_b,
+                needs_digit,
+                None if anchor is None else (
+                    tuple(needle.encode("ascii") for needle in anchor[0]), anchor[1]
+                ),
+                normalise,
+                None if runs is None else _run_anchors(pii_type, pattern_b),
+            ))
+    except (UnicodeEncodeError, re.error, ValueError):
+        return False
+    return tuple(plan_b)
 
 
 class ExfiltrationGuard:
@@ -82,11 +300,24 @@ class ExfiltrationGuard:
         # result["verified"] == False, result["risk"] == "DATA_EXFILTRATION"
     """
 
+    __slots__ = (
+        "allowed_endpoints",
+        "_pii_patterns",
+        "_scan_plan",
+        "_scan_plan_ascii",
+        "_scan_plan_bytes",
+        "_indexed_endpoints",
+        "_allowed_prefixes",
+        "_allowed_hosts",
+        "_endpoint_decisions",
+    )
+
     def __init__(
         self,
         allowed_endpoints: Optional[List[str]] = None,
         pii_checks: Optional[List[str]] = None,
         custom_pii_patterns: Optional[Dict[str, str]] = None,
+        pattern_order: Optional[List[str]] = None,
     ):
         """
         Args:
@@ -97,6 +328,9 @@ class ExfiltrationGuard:
             pii_checks: Subset of PII type names to enable. Defaults to all
                 built-in types except ``PASSPORT`` (opt-in).
             custom_pii_patterns: Additional ``{name: regex_string}`` patterns.
+            pattern_order: PII type names to scan (and report) first, in
+                this order. Putting the types most likely to occur first
+                shortens ``first_only`` scans of payloads that leak.
         """
         # Distinguish None (use defaults) from [] (block all)
         if allowed_endpoints is not None:
@@ -110,73 +344,103 @@ class ExfiltrationGuard:
                 "http://127.0.0.1",
             ]
 
-        # Build active PII patterns
-        if pii_checks is not None:
-            active_pii = {k: v for k, v in _PII_PATTERNS.items() if k in pii_checks}
-        else:
-            active_pii = {k: v for k, v in _PII_PATTERNS.items() if k in _DEFAULT_PII_CHECKS}
-        if custom_pii_patterns:
-            for name, pattern_str in custom_pii_patterns.items():
-                active_pii[name] = re.compile(pattern_str)
-        self._pii_patterns = active_pii
+        # Build active PII patterns. pii_checks is only used for
+        # membership tests, so a frozenset is an equivalent cache key
+        # (a bare string is kept as is: its "in" means substring).
+        checks_key = pii_checks
+        if pii_checks is not None and not isinstance(pii_checks, str):
+            checks_key = frozenset(pii_checks)
+        custom_key = tuple(custom_pii_patterns.items()) if custom_pii_patterns else ()
+        order_key = tuple(pattern_order) if pattern_order else ()
+        active_pii, self._scan_plan, self._scan_plan_ascii = _build_scan_plans(
+            checks_key, custom_key, order_key
+        )
+        self._pii_patterns = dict(active_pii)
+        self._scan_plan_bytes = None
+        self._indexed_endpoints: Optional[Tuple[str, ...]] = None
+
+    def _endpoint_index(self) -> Tuple[Tuple[str, ...], Dict[str, frozenset]]:
+        """
+        Pre-parsed allowlist: lowercased prefixes, and a map from each
+        allowed hostname to the schemes permitted for it ("" for entries
+        without a scheme). Rebuilt only when allowed_endpoints changes.
+        """
+        endpoints = tuple(self.allowed_endpoints)
+        if endpoints != self._indexed_endpoints:
+            hosts: Dict[str, set] = {}
+            for allowed in endpoints:
+                allowed_lower = allowed.lower()
+                try:
+                    _allowed_parsed = urlsplit(allowed)
+                    allowed_host = _allowed_parsed.hostname or allowed_lower
+                    allowed_scheme = _allowed_parsed.scheme
+                except ValueError:
+                    allowed_host = allowed_lower
+                    allowed_scheme = ""
+                hosts.setdefault(allowed_host, set()).add(allowed_scheme)
+            self._allowed_prefixes = tuple(a.lower() for a in endpoints)
+            self._allowed_hosts = {h: frozenset(s) for h, s in hosts.items()}
+            self._indexed_endpoints = endpoints
+            self._endpoint_decisions = {}
+        return self._allowed_prefixes, self._allowed_hosts
 
     def _is_allowed_endpoint(self, url: str) -> bool:
         """Check if URL matches any allowed endpoint prefix or hostname."""
+        prefixes, hosts = self._endpoint_index()
+        # Agents call the same few URLs over and over; remember the verdicts
+        # until the allowlist changes (the index rebuild drops them)
+        decisions = self._endpoint_decisions
+        allowed = decisions.get(url)
+        if allowed is None:
+            allowed = self._check_endpoint(url, prefixes, hosts)
+            if len(decisions) >= _ENDPOINT_CACHE_SIZE:
+                decisions.clear()
+            decisions[url] = allowed
+        return allowed
+
+    def _check_endpoint(
+        self, url: str, prefixes: Tuple[str, ...], hosts: Dict[str, frozenset]
+    ) -> bool:
         url_clean = url.strip()
-        url_lower = url_clean.lower()
+        # Agent-built URLs are usually lowercase already; islower()
+        # implies lower() would return an equal string, so skip the copy
+        url_lower = url_clean if url_clean.islower() else url_clean.lower()
         try:
-            _parsed_url = urlparse(url_clean)
+            _parsed_url = urlsplit(url_clean)
             parsed_host = _parsed_url.hostname or ""
             url_scheme = _parsed_url.scheme
         except ValueError:
             return False
 
-        for allowed in self.allowed_endpoints:
-            if self._matches_allowed_entry(url_lower, parsed_host, url_scheme, allowed):
+        # Hostname-only / exact match — no implicit subdomain matching.
+        # Require scheme compatibility if the allowlist entry specifies one.
+        schemes = hosts.get(parsed_host)
+        if schemes is not None:
+            if url_scheme and url_scheme in schemes:
                 return True
-        return False
-
-    def _matches_allowed_entry(
-        self, url_lower: str, parsed_host: str, url_scheme: str, allowed: str
-    ) -> bool:
-        """
-        Check if URL matches one specific allowlist entry.
-
-        Refactored to reduce complexity of _is_allowed_endpoint.
-        """
-        allowed_lower = allowed.lower()
-        # Prefix match — require path boundary to prevent
-        # 'https://api.openai.com.evil.com' bypassing the allowlist
-        if url_lower.startswith(allowed_lower):
-            rest = url_lower[len(allowed_lower) :]
-            if not rest or rest[0] in ("/", "?", "#", ":"):
+            # Schemeless allowlist entry: default to safe web protocols only
+            if "" in schemes and url_scheme in ("http", "https"):
                 return True
 
-        # Hostname-only / exact match
-        try:
-            _allowed_parsed = urlparse(allowed)
-            allowed_host = _allowed_parsed.hostname or allowed_lower
-            allowed_scheme = _allowed_parsed.scheme
-        except ValueError:
-            allowed_host = allowed_lower
-            allowed_scheme = ""
-
-        # Exact match only — no implicit subdomain matching.
-        # Require scheme compatibility if the allowlist entry specifies one.
-        if parsed_host == allowed_host:
-            if allowed_scheme:
-                if url_scheme == allowed_scheme:
+        # Prefix match — require path boundary to prevent
+        # 'https://api.openai.com.evil.com' bypassing the allowlist.
+        # One C-level startswith over the whole tuple rules out most
+        # URLs before the per-prefix boundary checks.
+        if not url_lower.startswith(prefixes):
+            return False
+        for allowed_lower in prefixes:
+            if url_lower.startswith(allowed_lower):
+                rest = url_lower[len(allowed_lower) :]
+                if not rest or rest[0] in ("/", "?", "#", ":"):
                     return True
-            elif url_scheme in ("http", "https"):
-                # Schemeless allowlist entry: default to safe web protocols only
-                return True
         return False
 
     def verify_outbound_call(
         self,
         destination_url: str,
-        payload: str = "",
+        payload: Union[str, bytes, bytearray, memoryview] = "",
         method: str = "POST",
+        first_only: bool = False,
     ) -> Dict[str, Any]:
         """
         Verify an outbound API call before execution.
@@ -184,7 +448,12 @@ class ExfiltrationGuard:
         Args:
             destination_url: The full URL the agent is attempting to call.
             payload: The request body / payload (string or JSON-encoded).
+                Raw ``bytes``-like bodies are scanned without decoding
+                when they are ASCII.
             method: HTTP method (for logging). Default: ``"POST"``.
+            first_only: Stop the PII scan at the first type found. The
+                verdict is the same, but ``pii_detected`` lists only
+                that type. Default: ``False``.
 
         Returns:
             Dict with ``verified`` bool plus IRAC audit fields.
@@ -226,7 +495,7 @@ class ExfiltrationGuard:
 
         # 2. PII scan on payload
         if payload:
-            pii_hits = self._scan_payload_for_pii(payload)
+            pii_hits = self._scan_payload_for_pii(payload, first_only)
             if pii_hits:
                 pii_types = ", ".join(hit["type"] for hit in pii_hits)
                 verdict = {
@@ -266,38 +535,136 @@ class ExfiltrationGuard:
             AUDIT_CONCL: "Verified: call is compliant.",
         }
 
-    def _scan_payload_for_pii(self, payload: str) -> List[Dict[str, Any]]:
-        """Scan payload string for PII matches. Returns list of findings."""
+    def verify_outbound_calls(self, calls: List[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """
+        Verify a batch of outbound calls, e.g. a whole conversation log.
+
+        Equivalent to calling ``verify_outbound_call`` on each, but when
+        only built-in PII types are enabled the text payloads are
+        scanned once, joined, and rescanned individually only if the
+        joined scan finds something.
+
+        Args:
+            calls: ``(destination_url, payload, method)`` tuples; trailing
+                items may be omitted as in ``verify_outbound_call``.
+
+        Returns:
+            One verdict per call, in order.
+        """
+        payloads = [call[1] for call in calls if len(call) > 1 and call[1]]
+        clean = False
+        if payloads and all(isinstance(p, str) for p in payloads) and all(
+            v is _PII_PATTERNS.get(k) for k, v in self._pii_patterns.items()
+        ):
+            # No built-in pattern can match across a NUL, and \b treats
+            # it like the end of a payload: the join has a finding
+            # exactly when some payload does
+            clean = not self._scan_payload_for_pii("\x00".join(payloads), first_only=True)
+        if not clean:
+            return [self.verify_outbound_call(*call) for call in calls]
+        # Verdicts for calls with a clean payload do not depend on it
+        return [self.verify_outbound_call(call[0], "", *call[2:]) for call in calls]
+
+    def _bytes_scan_plan(self):
+        """The bytes-compiled scan plan, or False if there is none."""
+        if self._scan_plan_bytes is None:
+            self._scan_plan_bytes = _build_bytes_scan_plan(self._scan_plan)
+        return self._scan_plan_bytes
+
+    def _scan_payload_for_pii(
+        self, payload: Union[str, bytes, bytearray, memoryview], first_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan payload string or bytes for PII matches. Returns list of
+        findings; with first_only, just the first in reporting order.
+        """
         findings: List[Dict[str, Any]] = []
-        # Normalise: also scan a copy with spaces/hyphens removed to
-        # catch formatted card numbers like "4111 1111 1111 1111"
-        normalised = re.sub(r"[\s\-]", "", payload)
-
-        for pii_type, pattern in self._pii_patterns.items():
-            text_to_scan = normalised if pii_type == "CREDIT_CARD" else payload
-            matches = pattern.findall(text_to_scan)
-            if matches:
-                findings.append({
-                    "type": pii_type,
-                    "count": len(matches),
-                    "message": f"Found {len(matches)} instance(s) of {pii_type}.",
-                })
+        folded = None
+        has_digit = None
+
+        plan = None
+        if isinstance(payload, (bytes, bytearray, memoryview)):
+            if isinstance(payload, memoryview):
+                payload = payload.tobytes()
+            if payload.isascii() and _INFO_SEPARATORS_B.search(payload) is None:
+                plan = self._bytes_scan_plan() or None
+            if plan is None:
+                payload = payload.decode("utf-8", "ignore")
+        is_text = plan is None
+        if is_text:
+            # ASCII-mode \s misses \x1c-\x1f, so those payloads take the Unicode plan
+            if payload.isascii() and _INFO_SEPARATORS.search(payload) is None:
+                plan = self._scan_plan_ascii
+            else:
+                plan = self._scan_plan
+
+        for pii_type, pattern, needs_digit, anchor, normalise, runs in plan:
+            if needs_digit:
+                if has_digit is None:
+                    has_digit = _has_digit(payload)
+                if not has_digit:
+                    continue
+            if anchor is not None:
+                needles, ignore_case = anchor
+                if ignore_case and folded is None:
+                    # ASCII bytes: lower() is the full case fold
+                    folded = payload.casefold() if is_text else payload.lower()
+                haystack = folded if ignore_case else payload
+                for needle in needles:
+                    if needle in haystack:
+                        break
+                else:
+                    continue
+            if normalise:
+                # Normalise: scan a copy with spaces/hyphens removed to
+                # catch formatted card numbers like "4111 1111 1111 1111"
+                if not is_text:
+                    text_to_scan = payload.translate(None, _STRIP_BYTES)
+                elif payload.isascii():
+                    text_to_scan = payload.translate(_STRIP_TABLE)
+                else:
+                    text_to_scan = _STRIP_RE.sub("", payload)
+            else:
+                text_to_scan = payload
+            if runs is not None:
+                count = _count_by_runs(pattern, runs, text_to_scan)
+                if not count:
+                    continue
+            else:
+                # Most payloads are clean: a bare search settles them
+                # without setting up an iterator. On a hit, count matches
+                # as they stream; findall would build a list of every
+                # matched substring only to take its length.
+                if pattern.search(text_to_scan) is None:
+                    continue
+                count = sum(1 for _ in pattern.finditer(text_to_scan))
+            findings.append({
+                "type": pii_type,
+                "count": count,
+                "message": f"Found {count} instance(s) of {pii_type}.",
+            })
+            if first_only:
+                break
         return findings
 
-    def scan_payload(self, payload: str) -> Dict[str, Any]:
+    def scan_payload(
+        self, payload: Union[str, bytes, bytearray, memoryview], first_only: bool = False
+    ) -> Dict[str, Any]:
         """
         Standalone PII scan without endpoint check.
 
         Useful for scanning LLM outputs before storing or forwarding them.
 
         Args:
-            payload: String content to scan.
+            payload: String content to scan, or raw ``bytes``-like content.
+            first_only: Stop at the first PII type found; ``pii_detected``
+                then lists only that type. Default: ``False``.
 
         Returns:
             Dict with ``verified`` bool plus IRAC audit fields.
         """
         _rule = "Payloads must not contain unmasked PII or secrets."
-        findings = self._scan_payload_for_pii(payload)
+        findings = self._scan_payload_for_pii(payload, first_only)
         if findings:
             pii_types = ", ".join(f["type"] for f in findings)
             return {
@@ -48,6 +48,14 @@ class RAGGuard:
         # result["verified"] == False, result["drm_rate"] == 0.5
     """
 
+    __slots__ = (
+        "_threshold",
+        "_th_num",
+        "_th_den",
+        "require_metadata",
+        "_rule",
+    )
+
     def __init__(
         self,
         max_drm_rate: Fraction | str | int = Fraction(0),
@@ -67,16 +75,27 @@ class RAGGuard:
                 "max_drm_rate must be Fraction, str, or int to ensure symbolic precision. "
                 "Floats are not permitted."
             )
-        try:
-            threshold = Fraction(max_drm_rate)
-        except (ValueError, TypeError) as e:
-            raise RAGGuardConfigError(f"Invalid max_drm_rate: {e}") from e
-
-        if not Fraction(0) <= threshold <= Fraction(1):
+        if isinstance(max_drm_rate, Fraction):
+            threshold = max_drm_rate  # immutable; no need to re-normalise
+        else:
+            try:
+                threshold = Fraction(max_drm_rate)
+            except (ValueError, TypeError) as e:
+                raise RAGGuardConfigError(f"Invalid max_drm_rate: {e}") from e
+
+        # 0 <= n/d <= 1 with d > 0, checked without building Fraction bounds
+        if not 0 <= threshold.numerator <= threshold.denominator:
             raise RAGGuardConfigError("max_drm_rate must be between 0 and 1")
         # Store as exact Fraction — no IEEE-754 round-trip at comparison time
         self._threshold: Fraction = threshold
+        # Integer form for the per-call comparison (Fraction ops are slow)
+        self._th_num = threshold.numerator
+        self._th_den = threshold.denominator
         self.require_metadata = require_metadata
+        self._rule = (
+            f"DRM rate must not exceed {float(threshold):.1%} "
+            f"(max_drm_rate threshold)."
+        )
 
     @property
     def max_drm_rate(self) -> float:
@@ -87,6 +106,7 @@ class RAGGuard:
         self,
         target_document_id: str,
         retrieved_chunks: List[Dict[str, Any]],
+        early_exit: bool = False,
     ) -> Dict[str, Any]:
         """
         Verify that all retrieved chunks belong to the target document.
@@ -96,17 +116,20 @@ class RAGGuard:
                 Must be a non-empty string.
             retrieved_chunks: List of chunk dicts. Each chunk should have
                 ``metadata.document_id`` set.
+            early_exit: If True, stop as soon as the DRM threshold is
+                exceeded (with the default zero tolerance, at the first
+                mismatch). ``chunks_checked``, ``mismatched_count`` and
+                ``details`` then cover only the chunks evaluated, and
+                ``drm_rate`` is a lower bound.
 
         Returns:
-            Dict with ``verified`` bool plus IRAC audit fields.
+            Dict with ``verified`` bool plus IRAC audit fields, and
+            ``"early_exit": True`` when the scan stopped early.
         """
         if not target_document_id:
             raise ValueError("target_document_id must be a non-empty string.")
 
-        _rule = (
-            f"DRM rate must not exceed {float(self._threshold):.1%} "
-            f"(max_drm_rate threshold)."
-        )
+        _rule = self._rule
 
         if not retrieved_chunks:
             return {
@@ -120,44 +143,51 @@ class RAGGuard:
                 AUDIT_CONCL: "Verified: no chunks to evaluate.",
             }
 
+        total = len(retrieved_chunks)
+        # mismatch_count/total > threshold exactly when mismatch_count exceeds
+        # this integer; comparing Fraction objects dominates the clean path
+        allowed = self._th_num * total // self._th_den
         mismatched: List[Dict[str, Any]] = []
 
-        for chunk in retrieved_chunks:
-            chunk_id = chunk.get("id", "unknown")
+        # Chunk ids are only looked up for the (rare) mismatching chunks
+        checked = 0
+        for checked, chunk in enumerate(retrieved_chunks, 1):
             metadata = chunk.get("metadata")
-            if not isinstance(metadata, dict):
-                metadata = {}
-            chunk_doc_id = metadata.get(KEY_DOC_ID)
+            chunk_doc_id = metadata.get(KEY_DOC_ID) if isinstance(metadata, dict) else None
 
             if chunk_doc_id is None:
                 if self.require_metadata:
                     mismatched.append({
-                        "chunk_id": chunk_id,
+                        "chunk_id": chunk.get("id", "unknown"),
                         "issue": "MISSING_DOCUMENT_ID",
                         "wrong_source": None,
                     })
             elif chunk_doc_id != target_document_id:
                 mismatched.append({
-                    "chunk_id": chunk_id,
+                    "chunk_id": chunk.get("id", "unknown"),
                     "issue": "WRONG_DOCUMENT",
                     "wrong_source": chunk_doc_id,
                 })
+            else:
+                continue
+            if early_exit and len(mismatched) > allowed:
+                break
 
-        total = len(retrieved_chunks)
-        drm_fraction = Fraction(len(mismatched), total)
-        drm_float = round(float(drm_fraction), 4)
+        mismatch_count = len(mismatched)
+        drm_rate = mismatch_count / total
+        drm_float = round(drm_rate, 4)
 
-        if drm_fraction > self._threshold:
-            return {
+        if mismatch_count > allowed:
+            result = {
                 "verified": False,
                 "risk": "DOCUMENT_RETRIEVAL_MISMATCH",
                 "drm_rate": drm_float,
-                "chunks_checked": total,
+                "chunks_checked": checked,
                 "mismatched_count": len(mismatched),
                 "message": (
                     f"Blocked RAG injection: {len(mismatched)}/{total} chunks "
                     f"originated from the wrong source document. "
-                    f"DRM rate {float(drm_fraction):.1%} exceeds threshold "
+                    f"DRM rate {drm_rate:.1%} exceeds threshold "
                     f"{float(self._threshold):.1%}. This will cause hallucinations."
                 ),
                 "details": mismatched,
@@ -169,6 +199,9 @@ class RAGGuard:
                 ),
                 AUDIT_CONCL: f"Blocked: DRM rate {drm_float:.1%} exceeds threshold.",
             }
+            if checked < total:
+                result["early_exit"] = True
+            return result
 
         _success_message = (
             f"{len(mismatched)}/{total} mismatch(es) tolerated "
@@ -218,14 +251,12 @@ class RAGGuard:
         if not target_document_id:
             raise ValueError("target_document_id must be a non-empty string.")
 
-        def _chunk_matches(chunk: Dict[str, Any]) -> bool:
+        # When require_metadata=False, chunks with no document_id are kept
+        keep_missing = not self.require_metadata
+        valid: List[Dict[str, Any]] = []
+        for chunk in retrieved_chunks:
             metadata = chunk.get("metadata")
-            if not isinstance(metadata, dict):
-                metadata = {}
-            doc_id = metadata.get(KEY_DOC_ID)
-            if doc_id == target_document_id:
-                return True
-            # When require_metadata=False, chunks with no document_id are kept
-            return not self.require_metadata and doc_id is None
-
-        return [chunk for chunk in retrieved_chunks if _chunk_matches(chunk)]
+            doc_id = metadata.get(KEY_DOC_ID) if isinstance(metadata, dict) else None
+            if doc_id == target_document_id or (keep_missing and doc_id is None):
+                valid.append(chunk)
+        return valid
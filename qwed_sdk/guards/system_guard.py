@@ -4,8 +4,14 @@ Blocks dangerous commands and enforces sandboxing.
 """
 import re
 import os
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Dict, Any, List, Optional
 
+# Per-command checks, compiled once at import
+_TOKEN_SPLIT_RE = re.compile(r'[;\|\&\s]+')
+_PIPE_TO_SHELL_RE = re.compile(r'\|\s*(bash|sh|zsh|ksh|python|perl|ruby|node)')
+
 class SystemGuard:
     """
     Deterministic guard for system-level operations.
@@ -51,6 +57,62 @@ class SystemGuard:
             re.compile(p, re.IGNORECASE) 
             for p in (forbidden_path_patterns or self.DEFAULT_FORBIDDEN_PATHS)
         ]
+        self._indexed_rules = None
+
+    def _refresh_rules(self) -> None:
+        """
+        Rebuild the blocked-command set, the combined forbidden-path regex
+        and the script prefilter when blocked_commands or forbidden_patterns
+        has changed, so rules added after construction take effect.
+        """
+        rules = (tuple(self.blocked_commands), tuple(self.forbidden_patterns))
+        if rules != self._indexed_rules:
+            self._blocked_set = frozenset(rules[0])
+            self._forbidden_any = self._combine_forbidden_patterns()
+            self._script_prefilter = self._build_script_prefilter()
+            self._indexed_rules = rules
+
+    def _combine_forbidden_patterns(self) -> Optional["re.Pattern[str]"]:
+        """
+        Join the forbidden path patterns into one alternation, so a path or
+        command is checked in a single search. Returns None when they cannot
+        be joined safely (capture groups would renumber backreferences).
+        """
+        if any(p.groups for p in self.forbidden_patterns):
+            return None
+        try:
+            return re.compile(
+                "|".join(f"(?:{p.pattern})" for p in self.forbidden_patterns),
+                re.IGNORECASE,
+            ) if self.forbidden_patterns else None
+        except re.error:
+            return None
+
+    def _matches_forbidden(self, text: str) -> bool:
+        if self._forbidden_any is not None:
+            return self._forbidden_any.search(text) is not None
+        return any(p.search(text) for p in self.forbidden_patterns)
+
+    def _build_script_prefilter(self) -> Optional["re.Pattern[str]"]:
+        """
+        Union every line-level check into one multiline regex.
+
+        The union is a superset of ``verify_shell_command``: any line that
+        could fail a check contains a match, so a whole script can be
+        scanned in a single pass and only the matching lines re-checked.
+        Returns None if the configured patterns cannot be combined.
+        """
+        if any(p.groups for p in self.forbidden_patterns):
+            return None
+        commands = "|".join(re.escape(c) for c in self.blocked_commands if c)
+        alternatives = [r"`", r"\$\(", r"\|[^\S\n]*(?:bash|sh|zsh|ksh|python|perl|ruby|node)"]
+        if commands:
+            alternatives.append(rf"(?<![^;|&\s/])(?:{commands})(?=[;|&\s]|$)")
+        alternatives.extend(f"(?:{p.pattern})" for p in self.forbidden_patterns)
+        try:
+            return re.compile("|".join(alternatives), re.IGNORECASE | re.MULTILINE)
+        except re.error:
+            return None
     
     def verify_shell_command(self, command: str) -> Dict[str, Any]:
         """
@@ -59,6 +121,10 @@ class SystemGuard:
         Returns:
             {"verified": True/False, "risk": str, "message": str}
         """
+        self._refresh_rules()
+        return self._check_command(command)
+
+    def _check_command(self, command: str) -> Dict[str, Any]:
         if not command or not command.strip():
             return {"verified": True, "message": "Empty command."}
         
@@ -67,11 +133,12 @@ class SystemGuard:
         
         # 1. Check for blocked base commands
         # Split by common shell operators to get base command
-        tokens = re.split(r'[;\|\&\s]+', cmd_lower)
-        base_commands = [t.split('/')[-1] for t in tokens if t]  # Handle full paths
+        tokens = _TOKEN_SPLIT_RE.split(cmd_lower)
+        base_commands = [t.rpartition('/')[2] for t in tokens if t]  # Handle full paths
         
+        blocked = self._blocked_set
         for base_cmd in base_commands:
-            if base_cmd in self.blocked_commands:
+            if base_cmd in blocked:
                 return {
                     "verified": False,
                     "risk": "BLOCKED_COMMAND",
@@ -79,7 +146,7 @@ class SystemGuard:
                 }
         
         # 2. Check for pipe to shell (common RCE pattern: curl ... | bash)
-        if re.search(r'\|\s*(bash|sh|zsh|ksh|python|perl|ruby|node)', cmd_lower):
+        if _PIPE_TO_SHELL_RE.search(cmd_lower):
             return {
                 "verified": False,
                 "risk": "PIPE_TO_SHELL",
@@ -87,13 +154,12 @@ class SystemGuard:
             }
         
         # 3. Check for path traversal / forbidden paths
-        for pattern in self.forbidden_patterns:
-            if pattern.search(command):
-                return {
-                    "verified": False,
-                    "risk": "PATH_VIOLATION",
-                    "message": f"Access to protected path pattern is denied."
-                }
+        if self._matches_forbidden(command):
+            return {
+                "verified": False,
+                "risk": "PATH_VIOLATION",
+                "message": f"Access to protected path pattern is denied."
+            }
         
         # 4. Check for backticks or $() command substitution
         if '`' in command or '$(' in command:
@@ -104,6 +170,55 @@ class SystemGuard:
             }
         
         return {"verified": True, "message": "Command passed security checks."}
+
+    def verify_shell_script(self, script: str) -> Dict[str, Any]:
+        """
+        Statically analyze a whole shell script, line by line.
+
+        Blank lines and ``#`` comments are skipped. Equivalent to calling
+        ``verify_shell_command`` on every line, but the script is scanned
+        once and only suspicious lines are analyzed individually.
+
+        Returns:
+            {"verified": True/False, "violations": [{"line", "risk", "message"}, ...]}
+        """
+        self._refresh_rules()
+        lines = [line.strip() for line in script.splitlines()]
+
+        if self._script_prefilter is None:
+            candidates = range(len(lines))
+        else:
+            # Offsets of each line start in the joined text -> line index
+            starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
+            hit = set()
+            for m in self._script_prefilter.finditer("\n".join(lines)):
+                first = bisect_right(starts, m.start()) - 1
+                last = bisect_right(starts, max(m.end() - 1, m.start())) - 1
+                hit.update(range(first, last + 1))
+            candidates = sorted(hit)
+
+        violations = []
+        for idx in candidates:
+            line = lines[idx]
+            if not line or line.startswith("#"):
+                continue
+            result = self._check_command(line)
+            if not result["verified"]:
+                violations.append({
+                    "line": idx + 1,
+                    "risk": result.get("risk", "SECURITY_RISK"),
+                    "message": result.get("message", "Dangerous command detected"),
+                })
+
+        if violations:
+            return {
+                "verified": False,
+                "risk": "DANGEROUS_SCRIPT",
+                "violations": violations,
+                "message": f"Found {len(violations)} dangerous line(s) in script."
+            }
+
+        return {"verified": True, "message": "Script passed security checks."}
     
     def verify_file_access(
         self, 
@@ -120,14 +235,15 @@ class SystemGuard:
         if not filepath:
             return {"verified": False, "risk": "EMPTY_PATH", "message": "Empty file path."}
         
+        self._refresh_rules()
+        
         # 1. Check forbidden patterns first
-        for pattern in self.forbidden_patterns:
-            if pattern.search(filepath):
-                return {
-                    "verified": False,
-                    "risk": "FORBIDDEN_PATH",
-                    "message": f"Access to path matching forbidden pattern is denied."
-                }
+        if self._matches_forbidden(filepath):
+            return {
+                "verified": False,
+                "risk": "FORBIDDEN_PATH",
+                "message": f"Access to path matching forbidden pattern is denied."
+            }
         
         # 2. Resolve to absolute path
         try:
@@ -32,6 +32,9 @@ Example:
 from typing import Optional, Dict, Any, List
 import json
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 # QWED Branding Colors
@@ -83,7 +86,7 @@ except ImportError:
     sympy = None
 
 try:
-    from z3 import Solver, sat, Bool, Int, Real
+    from z3 import Solver, sat, Bool, Int, Real, And, Or, Not, Implies
 except ImportError:
     Solver = None
 
@@ -92,6 +95,7 @@ except ImportError:
 
 # Validators
 import ast
+from functools import lru_cache
 
 
 class UnsafeExpressionError(ValueError):
@@ -107,16 +111,14 @@ class DisallowedExpressionError(UnsafeExpressionError):
 
 def _has_string_arg(node: ast.Call) -> bool:
     """Check if a Call node has any string literal arguments."""
+    # ast.parse emits string literals as ast.Constant on every supported
+    # Python, so the deprecated ast.Str alias needs no separate check.
     for arg in node.args:
         if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
             return True
-        if hasattr(ast, 'Str') and isinstance(arg, ast.Str):
-            return True
     for kw in node.keywords:
         if isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
             return True
-        if hasattr(ast, 'Str') and isinstance(kw.value, ast.Str):
-            return True
     return False
 
 
@@ -171,24 +173,57 @@ def _is_safe_sympy_attribute(node: ast.Attribute) -> bool:
     return node.value.id == 'sympy' and node.attr in _ALLOWED_SYMPY_FUNCS
 
 
-def _is_safe_sympy_node(node: ast.AST) -> bool:
-    """Validate a single AST node for sympy expression safety."""
-    if isinstance(node, ast.Call):
-        return _is_safe_sympy_call(node)
-    if isinstance(node, ast.Attribute):
-        return _is_safe_sympy_attribute(node)
-    if isinstance(node, _SAFE_SYMPY_NODE_TYPES):
-        return True
-    if hasattr(ast, 'Str') and isinstance(node, ast.Str):
-        return True
-    if hasattr(ast, 'Num') and isinstance(node, ast.Num):
-        return True
-    return False
+def _is_safe_ast(
+    tree: ast.AST,
+    safe_types: frozenset,
+    checks: dict,
+    child_fields: Optional[dict] = None
+) -> bool:
+    """Check every node of tree in one depth-first pass.
+
+    Node types in safe_types pass outright; types with an entry in checks
+    pass if their check does; anything else rejects the whole tree at once.
+    Children are read straight from _fields, which is much cheaper than
+    ast.walk for the small expressions LLMs return. child_fields can
+    narrow that per type to skip subtrees a node's check already covers.
+    """
+    child_fields = child_fields or {}
+    todo = [tree]
+    pop, push, extend = todo.pop, todo.append, todo.extend
+    node_base = ast.AST
+    while todo:
+        node = pop()
+        cls = type(node)
+        if cls not in safe_types:
+            check = checks.get(cls)
+            if check is None or not check(node):
+                return False
+        for field in child_fields.get(cls, cls._fields):
+            value = getattr(node, field, None)
+            if isinstance(value, node_base):
+                push(value)
+            elif type(value) is list:
+                extend(v for v in value if isinstance(v, node_base))
+    return True
+
+
+_SAFE_SYMPY_TYPE_SET = frozenset(_SAFE_SYMPY_NODE_TYPES)
+_SYMPY_NODE_CHECKS = {
+    ast.Call: _is_safe_sympy_call,
+    ast.Attribute: _is_safe_sympy_attribute,
+}
+# Subtrees already decided by the parent: a passing call check implies its
+# func is safe, an attribute check covers sympy.<name>, and ctx is Load.
+_SYMPY_CHILD_FIELDS = {
+    ast.Call: ('args', 'keywords'),
+    ast.Attribute: (),
+    ast.Name: (),
+}
 
 
 def _is_safe_sympy_ast(tree: ast.AST) -> bool:
     """Validate that an AST tree only contains allowed SymPy operations."""
-    return all(_is_safe_sympy_node(node) for node in ast.walk(tree))
+    return _is_safe_ast(tree, _SAFE_SYMPY_TYPE_SET, _SYMPY_NODE_CHECKS, _SYMPY_CHILD_FIELDS)
 
 
 def _is_safe_sympy_expr(expr_str: str) -> bool:
@@ -203,25 +238,50 @@ def _is_safe_sympy_expr(expr_str: str) -> bool:
         return False
 
 
-def _safe_eval_sympy_expr(expr_str: str, local_vars: dict):
-    """Safely evaluate a SymPy expression using AST compilation.
+def _compile_safe_expr(stripped: str, is_safe, filename: str):
+    """Parse, validate and compile a stripped expression.
 
-    Mirrors _safe_eval_z3_expr for the SymPy/math verification path.
-    Parses once, validates AST, compiles, executes in restricted namespace.
+    Rejections are returned instead of raised so the lru_cache wrappers
+    below remember them too: None for disallowed nodes, the SyntaxError
+    message (a str) for invalid syntax, otherwise the compiled code object.
     """
-    stripped = expr_str.strip()
-
     try:
         tree = ast.parse(stripped, mode='eval')
     except SyntaxError as exc:
-        raise InvalidExpressionSyntaxError(str(exc)) from exc
-    if not _is_safe_sympy_ast(tree):
+        return str(exc)
+    if not is_safe(tree):
+        return None
+    # Compile the already-validated AST (no re-parse)
+    return compile(tree, filename, 'eval')
+
+
+@lru_cache(maxsize=1024)
+def _compile_safe_sympy(stripped: str):
+    """Cached _compile_safe_expr for the SymPy allow-list."""
+    return _compile_safe_expr(stripped, _is_safe_sympy_ast, '<sympy_expr>')
+
+
+def _checked_code(compiled):
+    """Return a cached code object or raise the error it was rejected with."""
+    if compiled is None:
         raise DisallowedExpressionError
+    if isinstance(compiled, str):
+        raise InvalidExpressionSyntaxError(compiled)
+    return compiled
+
 
-    code = compile(tree, '<sympy_expr>', 'eval')
+def _safe_eval_sympy_expr(expr_str: str, local_vars: dict):
+    """Safely evaluate a SymPy expression using AST compilation.
+
+    Mirrors _safe_eval_z3_expr for the SymPy/math verification path.
+    Parses once, validates AST, compiles, executes in restricted namespace.
+    Code objects are cached per expression string, since LLMs often
+    return the same expression for repeated queries.
+    """
+    code = _checked_code(_compile_safe_sympy(expr_str.strip()))
 
     # Defensively enforce restricted builtins (only abs, int)
-    restricted_ns = {k: v for k, v in local_vars.items() if k != "__builtins__"}
+    restricted_ns = dict(local_vars)
     restricted_ns["__builtins__"] = _SAFE_SYMPY_BUILTINS
 
     return eval(code, restricted_ns)  # noqa: S307  # nosec - AST-validated
@@ -232,24 +292,21 @@ _ALLOWED_Z3_NAMES = {'Bool', 'And', 'Or', 'Not', 'Implies'}
 _SAFE_Z3_NODE_TYPES = (ast.Constant, ast.Expression, ast.Load)
 
 
-def _is_safe_z3_node(node: ast.AST) -> bool:
-    """Validate a single AST node for Z3 expression safety."""
-    if isinstance(node, ast.Call):
-        return isinstance(node.func, ast.Name) and node.func.id in _ALLOWED_Z3_NAMES
-    if isinstance(node, ast.Name):
-        return node.id in _ALLOWED_Z3_NAMES
-    if isinstance(node, _SAFE_Z3_NODE_TYPES):
-        return True
-    if hasattr(ast, 'Str') and isinstance(node, ast.Str):
-        return True
-    if hasattr(ast, 'Num') and isinstance(node, ast.Num):
-        return True
-    return False
+_SAFE_Z3_TYPE_SET = frozenset(_SAFE_Z3_NODE_TYPES)
+_Z3_NODE_CHECKS = {
+    ast.Call: lambda node: isinstance(node.func, ast.Name) and node.func.id in _ALLOWED_Z3_NAMES,
+    ast.Name: lambda node: node.id in _ALLOWED_Z3_NAMES,
+}
+# A passing call check implies its func is an allowed Name
+_Z3_CHILD_FIELDS = {
+    ast.Call: ('args', 'keywords'),
+    ast.Name: (),
+}
 
 
 def _is_safe_z3_ast(tree: ast.AST) -> bool:
     """Validate that an AST tree only contains allowed Z3 operations."""
-    return all(_is_safe_z3_node(node) for node in ast.walk(tree))
+    return _is_safe_ast(tree, _SAFE_Z3_TYPE_SET, _Z3_NODE_CHECKS, _Z3_CHILD_FIELDS)
 
 
 def _is_safe_z3_expr(expr_str: str) -> bool:
@@ -264,37 +321,120 @@ def _is_safe_z3_expr(expr_str: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1024)
+def _compile_safe_z3(stripped: str):
+    """Cached _compile_safe_expr for the Z3 allow-list."""
+    return _compile_safe_expr(stripped, _is_safe_z3_ast, '<z3_expr>')
+
+
 def _safe_eval_z3_expr(expr_str: str, z3_namespace: dict):
     """Safely evaluate a Z3 expression using AST compilation.
     
     Instead of eval(), this function:
-    1. Parses the expression into an AST (once)
+    1. Parses the expression into an AST (once per distinct string)
     2. Validates all nodes against the allow-list
     3. Compiles the validated AST into a code object
     4. Executes the compiled code in a restricted namespace (no builtins)
     
     This eliminates the eval() call that triggers S5334.
     """
-    stripped = expr_str.strip()
-    
-    # Parse once and validate the AST
-    try:
-        tree = ast.parse(stripped, mode='eval')
-    except SyntaxError as exc:
-        raise InvalidExpressionSyntaxError(str(exc)) from exc
-    if not _is_safe_z3_ast(tree):
-        raise DisallowedExpressionError
-    
-    # Compile the already-validated AST (no re-parse)
-    code = compile(tree, '<z3_expr>', 'eval')
+    code = _checked_code(_compile_safe_z3(expr_str.strip()))
     
     # Defensively strip builtins regardless of what the caller passes
-    restricted_ns = {k: v for k, v in z3_namespace.items() if k != "__builtins__"}
+    restricted_ns = dict(z3_namespace)
     restricted_ns["__builtins__"] = {}
     
     return eval(code, restricted_ns)  # noqa: S307  # nosec - AST-validated
 
 
+# Plain arithmetic that verify_math can answer without an LLM
+_LOCAL_ARITH_RE = re.compile(r"[0-9\s+\-*/().^]+")
+_LOCAL_ARITH_MAX_LENGTH = 200
+_LOCAL_ARITH_MAX_EXPONENT = 64
+_LOCAL_ARITH_TYPES = frozenset({
+    ast.Expression, ast.UnaryOp,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd,
+})
+
+
+def _is_bounded_binop(node: ast.BinOp) -> bool:
+    """Only allow powers of a literal to a small literal exponent."""
+    if not isinstance(node.op, ast.Pow):
+        return True
+    exponent = node.right
+    return (
+        type(node.left) is ast.Constant
+        and type(exponent) is ast.Constant
+        and type(exponent.value) is int
+        and exponent.value <= _LOCAL_ARITH_MAX_EXPONENT
+    )
+
+
+def _is_number_constant(node: ast.Constant) -> bool:
+    """Only allow int and float literals ("..." parses to Ellipsis)."""
+    return type(node.value) in (int, float)
+
+
+_LOCAL_ARITH_CHECKS = {ast.BinOp: _is_bounded_binop, ast.Constant: _is_number_constant}
+
+
+def _try_local_math(query: str) -> Optional[str]:
+    """Evaluate a pure-arithmetic query such as "What is 2+2?" locally.
+
+    Returns the result as a string, or None if the query is anything but
+    plain arithmetic (or fails to evaluate), in which case the LLM path
+    should handle it.
+    """
+    expr = query.strip()
+    if expr[:8].lower() == "what is ":
+        expr = expr[8:]
+    expr = expr.rstrip("? \t\n")
+    if (
+        len(expr) > _LOCAL_ARITH_MAX_LENGTH
+        or not _LOCAL_ARITH_RE.fullmatch(expr)
+        or not any(c.isdigit() for c in expr)
+    ):
+        return None
+    try:
+        tree = ast.parse(expr.replace("^", "**").strip(), mode='eval')
+    except SyntaxError:
+        return None
+    if not _is_safe_ast(tree, _LOCAL_ARITH_TYPES, _LOCAL_ARITH_CHECKS):
+        return None
+    code = compile(tree, '<local_arith>', 'eval')
+    try:
+        return str(eval(code, {"__builtins__": {}}))  # noqa: S307  # nosec - AST-validated
+    except (ArithmeticError, TypeError, ValueError):
+        # Division by zero, float overflow, an int too long to print, or
+        # operands the allow-list let through but arithmetic rejects
+        return None
+
+
+# Outermost {...} block, for models that wrap JSON in prose or code fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _parse_llm_json(response: str, *keys: str) -> List[str]:
+    """Extract the values for keys from a JSON-formatted LLM response.
+
+    Values are returned as stripped strings in the order of keys. Raises
+    ValueError if no JSON object can be recovered or a key is missing.
+    """
+    try:
+        data = json.loads(response)
+    except ValueError:
+        match = _JSON_OBJECT_RE.search(response)
+        if match is None:
+            raise ValueError("LLM response is not a JSON object")
+        data = json.loads(match.group(0))
+    if not isinstance(data, dict):
+        raise ValueError("LLM response is not a JSON object")
+    missing = [key for key in keys if key not in data]
+    if missing:
+        raise ValueError(f"LLM response missing key(s): {', '.join(missing)}")
+    return [str(data[key]).strip() for key in keys]
+
+
 @dataclass
 class VerificationResult:
     """Result from verification."""
@@ -366,6 +506,7 @@ class QWEDLocal:
         cache_ttl: int = 86400,  # 24 hours
         mask_pii: bool = False,  # NEW: Enable PII masking
         pii_entities: Optional[List[str]] = None,  # NEW: Custom PII types
+        cache_dir: Optional[str] = None,
         **kwargs
     ):
         """
@@ -378,6 +519,7 @@ class QWEDLocal:
             model: Model name (e.g., 'llama3', 'gpt-4o-mini', 'claude-3-opus')
             cache: Enable smart caching (default: True)
             cache_ttl: Cache time-to-live in seconds (default: 24 hours)
+            cache_dir: Directory for the persistent cache DB (default: ~/.qwed/cache)
             **kwargs: Additional arguments for LLM client
         
         Examples:
@@ -405,10 +547,15 @@ class QWEDLocal:
         # Initialize cache if enabled
         if self.use_cache:
             from qwed_sdk.cache import VerificationCache
-            self._cache = VerificationCache(ttl=cache_ttl)
+            self._cache = VerificationCache(cache_dir=cache_dir, ttl=cache_ttl)
         else:
             self._cache = None
         
+        # Z3 solver shared across verify_logic calls (created on first use);
+        # each check runs in its own push()/pop() scope under the lock.
+        self._z3_solver = None
+        self._z3_lock = threading.Lock()
+        
         # Initialize PII detector (optional)
         self.mask_pii = mask_pii
         self._pii_detector = None
@@ -430,6 +577,18 @@ class QWEDLocal:
         
         # Check verifiers available
         self._check_verifiers()
+        
+        # Evaluation namespaces, built once; the safe-eval helpers copy
+        # them into a restricted namespace on every call.
+        self._sympy_ns = {"sympy": sympy, "x": sympy.Symbol('x')} if self.has_sympy else None
+        self._z3_ns = {
+            "Bool": Bool,
+            "And": And,
+            "Or": Or,
+            "Not": Not,
+            "Implies": Implies,
+            "__builtins__": {}
+        } if self.has_z3 else None
     
     def _init_llm_client(self, **kwargs):
         """Initialize the appropriate LLM client."""
@@ -507,12 +666,20 @@ class QWEDLocal:
         else:
             print("⚠️  Caching is disabled.")
     
-    def _call_llm(self, prompt: str, system: Optional[str] = None) -> str:
+    def _call_llm(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_mode: bool = False
+    ) -> str:
         """
         Call the LLM with a prompt.
         
         This is the ONLY place where user data touches the LLM.
         No data is sent to QWED servers!
+        
+        With json_mode, OpenAI-compatible clients are asked for a JSON
+        object response; other providers rely on the prompt alone.
         """
         # PII MASKING (Phase 19 privacy shield)
         if self.mask_pii and self._pii_detector:
@@ -532,10 +699,12 @@ class QWEDLocal:
                 messages.append({"role": "system", "content": system})
             messages.append({"role": "user", "content": prompt})
             
+            extra = {"response_format": {"type": "json_object"}} if json_mode else {}
             response = self.llm_client.chat.completions.create(
                 model=self.model,
                 messages=messages,
-                temperature=0.0  # Deterministic for verification
+                temperature=0.0,  # Deterministic for verification
+                **extra
             )
             return response.choices[0].message.content
         
@@ -574,13 +743,53 @@ class QWEDLocal:
         # For now, try math verification
         return self.verify_math(query)
     
+    def verify_batch(
+        self,
+        queries: List[str],
+        max_workers: int = 8
+    ) -> List[VerificationResult]:
+        """
+        Verify many queries concurrently.
+        
+        Each query goes through verify(); the LLM round-trips run in a
+        thread pool, so a batch takes roughly as long as its slowest
+        queries rather than the sum of all of them.
+        
+        Args:
+            queries: Natural language queries
+            max_workers: Maximum number of queries in flight at once
+        
+        Returns:
+            VerificationResults in the same order as queries
+        
+        Example:
+            results = client.verify_batch(["What is 2+2?", "Derivative of x^2?"])
+        """
+        if len(queries) <= 1:
+            return [self.verify(query) for query in queries]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(self.verify, queries))
+    
     def verify_math(self, query: str) -> VerificationResult:
         """
         Verify mathematical query.
         
         Uses SymPy for symbolic verification.
-        Checks cache first to save API costs!
+        Pure arithmetic ("What is 2+2?") is evaluated locally without an
+        LLM call; otherwise checks cache first to save API costs!
         """
+        local_value = _try_local_math(query)
+        if local_value is not None:
+            if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
+                print(f"{QWED.SUCCESS}✅ VERIFIED{QWED.RESET} {QWED.VALUE}→ {local_value}{QWED.RESET} {QWED.INFO}(local arithmetic, no LLM call){QWED.RESET}")
+            return VerificationResult(
+                verified=True,
+                value=local_value,
+                confidence=1.0,
+                evidence={"method": "local_arith"}
+            )
+        
         if not self.has_sympy:
             return VerificationResult(
                 verified=False,
@@ -588,8 +797,9 @@ class QWEDLocal:
             )
         
         # Check cache first (save $$!)
+        cache_key = f"math:{query}"
         if self._cache:
-            cached_result = self._cache.get(query)
+            cached_result = self._cache.get(cache_key)
             if cached_result:
                 if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
                     print(f"{QWED.SUCCESS}⚡ Cache HIT{QWED.RESET} {QWED.INFO}(saved API call!){QWED.RESET}")
@@ -599,42 +809,41 @@ class QWEDLocal:
         if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
             print(f"\n{QWED.BRAND}🔬 QWED Verification{QWED.RESET} {QWED.INFO}| Math Engine{QWED.RESET}")
         
-        # Step 1: Ask LLM for answer
-        prompt = f"""Solve this math problem and respond ONLY with the numerical answer:
+        # Step 1: Ask LLM for the answer and a SymPy expression in one call
+        prompt = f"""Solve this math problem and convert it to a SymPy expression that we can verify:
 
 {query}
 
-Answer (number only):"""
+Respond ONLY with a JSON object with these keys:
+- "answer": the numerical answer (number only)
+- "sympy_expr": the Python SymPy code to evaluate this, e.g. "sympy.simplify(2+2)" or "sympy.diff(x**2, x)"
+
+JSON:"""
         
         try:
-            llm_response = self._call_llm(prompt)
-            llm_answer = llm_response.strip()
+            llm_response = self._call_llm(prompt, json_mode=True)
+            try:
+                llm_answer, llm_expr = _parse_llm_json(llm_response, "answer", "sympy_expr")
+            except ValueError as e:
+                if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
+                    print(f"{QWED.ERROR}❌ Invalid LLM response: {str(e)}{QWED.RESET}")
+
+                return VerificationResult(
+                    verified=False,
+                    error=f"Invalid LLM response: {str(e)}"
+                )
             
             if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
                 print(f"{QWED.INFO}📝 LLM Response: {llm_answer}{QWED.RESET}")
             
-            # Step 2: Ask LLM for symbolic expression
-            expr_prompt = f"""Convert this to a SymPy expression that we can verify:
-
-{query}
-
-Respond with ONLY the Python SymPy code to evaluate this, nothing else.
-Example: "sympy.simplify(2+2)" or "sympy.diff(x**2, x)"
-
-SymPy code:"""
-            
-            llm_expr = self._call_llm(expr_prompt)
-            
-            # Step 3: Verify with SymPy
-            # Parse and evaluate the expression
-            # (In production, use safe eval with restricted namespace)
-            local_vars = {"sympy": sympy, "x": sympy.Symbol('x')}
-            
+            # Step 2: Verify with SymPy
+            # Parse and evaluate the expression in the client's SymPy
+            # namespace (copied into a restricted namespace per call)
             try:
                 # Use safe eval with AST whitelist (module-level validator)
 
                 # AST-validated eval via _safe_eval_sympy_expr (fixes S5334)
-                verified_result = _safe_eval_sympy_expr(llm_expr, local_vars)
+                verified_result = _safe_eval_sympy_expr(llm_expr, self._sympy_ns)
                 
                 # If it's an expression (like 2+2), evaluate it
                 if hasattr(verified_result, 'evalf'):
@@ -664,7 +873,7 @@ SymPy code:"""
                         "confidence": result.confidence,
                         "evidence": result.evidence
                     }
-                    self._cache.set(query, cache_data)
+                    self._cache.set(cache_key, cache_data)
                 
                 # Show result with branding
                 if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
@@ -714,9 +923,10 @@ SymPy code:"""
                 error="Z3 not installed. Run: pip install z3-solver"
             )
         
-        # Check cache first
+        # Check cache first (keyed apart from math results for the same text)
+        cache_key = f"logic:{query}"
         if self._cache:
-            cached_result = self._cache.get(query)
+            cached_result = self._cache.get(cache_key)
             if cached_result:
                 if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
                     print(f"{QWED.SUCCESS}⚡ Cache HIT{QWED.RESET} {QWED.INFO}(saved API call!){QWED.RESET}")
@@ -726,58 +936,54 @@ SymPy code:"""
         if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
             print(f"\n{QWED.BRAND}🔬 QWED Verification{QWED.RESET} {QWED.INFO}| Logic Engine{QWED.RESET}")
         
-        # Step 1: Ask LLM for answer
-        prompt = f"""Solve this logic problem and respond with TRUE or FALSE:
+        # Step 1: Ask LLM for the answer and a Z3 expression in one call
+        prompt = f"""Solve this logic problem and convert it to Python Z3 code:
 
 {query}
 
-Answer (TRUE or FALSE only):"""
+Respond ONLY with a JSON object with these keys:
+- "answer": TRUE or FALSE
+- "z3_expr": the Z3 boolean expression code, using Bool variables for propositions, e.g. "And(Bool('p'), Or(Bool('q'), Not(Bool('r'))))"
+
+JSON:"""
         
         try:
-            llm_response = self._call_llm(prompt)
-            llm_answer = llm_response.strip().upper()
+            llm_response = self._call_llm(prompt, json_mode=True)
+            try:
+                llm_answer, llm_expr = _parse_llm_json(llm_response, "answer", "z3_expr")
+            except ValueError as e:
+                if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
+                    print(f"{QWED.ERROR}❌ Invalid LLM response: {str(e)}{QWED.RESET}")
+
+                return VerificationResult(
+                    verified=False,
+                    error=f"Invalid LLM response: {str(e)}"
+                )
+            llm_answer = llm_answer.upper()
             
             if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
                 print(f"{QWED.INFO}📝 LLM Response: {llm_answer}{QWED.RESET}")
             
-            # Step 2: Ask LLM for Z3 boolean expression
-            expr_prompt = f"""Convert this logic statement to Python Z3 code:
-
-{query}
-
-Respond with ONLY the Z3 boolean expression code, nothing else.
-Use Bool variables for propositions.
-Example: "And(Bool('p'), Or(Bool('q'), Not(Bool('r'))))"
-
-Z3 code:"""
-            
-            llm_expr = self._call_llm(expr_prompt)
-            
-            # Step 3: Verify with Z3
+            # Step 2: Verify with Z3
             try:
-                from z3 import Bool, And, Or, Not, Implies, Solver, sat
-                
-                # Safe eval with Z3 namespace
-                z3_namespace = {
-                    "Bool": Bool,
-                    "And": And,
-                    "Or": Or, 
-                    "Not": Not,
-                    "Implies": Implies,
-                    "__builtins__": {}
-                }
-                
                 # Validate and execute using AST-safe evaluation
                 # Uses _safe_eval_z3_expr which parses, validates, compiles
                 # from AST, and executes without raw eval() (fixes S5334)
-                expr = _safe_eval_z3_expr(llm_expr, z3_namespace)
-                
-                # Use Z3 solver
-                solver = Solver()
-                solver.add(expr)
+                expr = _safe_eval_z3_expr(llm_expr, self._z3_ns)
                 
-                # Check satisfiability
-                result = solver.check()
+                # Use the shared Z3 solver, scoping the assertion to this call
+                with self._z3_lock:
+                    if self._z3_solver is None:
+                        self._z3_solver = Solver()
+                    solver = self._z3_solver
+                    solver.push()
+                    try:
+                        solver.add(expr)
+                        
+                        # Check satisfiability
+                        result = solver.check()
+                    finally:
+                        solver.pop()
                 is_satisfiable = (result == sat)
                 
                 # Compare with LLM answer
@@ -804,7 +1010,7 @@ Z3 code:"""
                         "confidence": verification_result.confidence,
                         "evidence": verification_result.evidence
                     }
-                    self._cache.set(query, cache_data)
+                    self._cache.set(cache_key, cache_data)
                 
                 # Show result
                 if HAS_COLOR and os.getenv("QWED_QUIET") != "1":
@@ -0,0 +1,129 @@
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+# benchmarks/ is a directory of scripts, not a package: load by path
+_PROFILER_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "benchmarks", "performance_profiler.py"
+)
+_spec = importlib.util.spec_from_file_location("performance_profiler", _PROFILER_PATH)
+performance_profiler = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(performance_profiler)
+
+PerformanceProfiler = performance_profiler.PerformanceProfiler
+
+
+@pytest.fixture
+def profiler():
+    return PerformanceProfiler(iterations=5, warmup=2, memory_iterations=1)
+
+
+class TestSkippedBenchmarks:
+    def test_import_error_is_skipped(self, profiler, capsys):
+        def needs_engine():
+            raise ModuleNotFoundError("No module named 'z3'")
+
+        result = profiler.benchmark("Solve", "Logic", needs_engine)
+        profiler.print_result(result)
+
+        assert result.skipped == "ModuleNotFoundError: No module named 'z3'"
+        assert result.iterations == 0
+        assert "[SKIP] Logic - Solve (not available" in capsys.readouterr().out
+
+    def test_other_errors_are_timed_not_skipped(self, profiler):
+        def broken():
+            raise ValueError("regression")
+
+        result = profiler.benchmark("Parse", "DSL", broken)
+
+        assert result.skipped is None
+        assert result.iterations == 5
+        assert result.success_rate == 0.0
+
+    def test_intermittent_errors_lower_success_rate(self, profiler):
+        calls = []
+
+        def flaky():
+            calls.append(None)
+            if len(calls) % 2:
+                raise RuntimeError("odd call")
+
+        result = profiler.benchmark("Flaky", "Math", flaky)
+
+        assert result.skipped is None
+        assert 0.0 < result.success_rate < 1.0
+
+
+class FakeClock:
+    """Stands in for the time module; only calls to the benchmark advance it."""
+
+    def __init__(self):
+        self.now_ns = 0
+
+    def perf_counter_ns(self):
+        return self.now_ns
+
+    def func(self, cost_ns):
+        def call():
+            self.now_ns += cost_ns
+        return call
+
+
+class TestBatchedTiming:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(performance_profiler, "time", clock)
+        return clock
+
+    @pytest.mark.parametrize("cost_ns, inner", [
+        (2_000_000, 1),    # 2 ms: one call already fills a 1 ms sample
+        (100_000, 10),     # 0.1 ms: ten calls reach 1 ms
+        (1_000, 1000),     # 1 us: a thousand calls reach 1 ms
+        (100, 1000),       # 0.1 us: capped at the largest batch size
+    ])
+    def test_batch_size_and_per_call_times(self, clock, cost_ns, inner):
+        profiler = PerformanceProfiler(iterations=4, warmup=1, memory_iterations=1, min_sample_ms=1.0)
+
+        result = profiler.benchmark("Op", "Engine", clock.func(cost_ns))
+
+        per_call_ms = cost_ns / 1e6
+        assert result.inner_loops == inner
+        assert profiler.inner == inner
+        assert result.avg_time_ms == pytest.approx(per_call_ms)
+        assert result.min_time_ms == pytest.approx(per_call_ms)
+        assert result.max_time_ms == pytest.approx(per_call_ms)
+        assert result.std_dev_ms == pytest.approx(0.0)
+        # One per-call time per sample, not one per call
+        assert result.total_time_ms == pytest.approx(4 * per_call_ms)
+        assert result.throughput_per_sec == pytest.approx(1000 / per_call_ms)
+        assert result.success_rate == 1.0
+
+    def test_min_sample_ms_drives_batch_size(self, clock):
+        profiler = PerformanceProfiler(iterations=2, warmup=1, memory_iterations=1, min_sample_ms=5.0)
+
+        result = profiler.benchmark("Op", "Engine", clock.func(100_000))
+
+        # 0.1 ms calls: 10 per batch is 1 ms, so 100 are needed for 5 ms
+        assert result.inner_loops == 100
+        assert result.avg_time_ms == pytest.approx(0.1)
+
+    def test_success_rate_counts_every_call_in_a_batch(self, clock):
+        calls = []
+
+        def every_third_fails():
+            clock.now_ns += 100_000
+            calls.append(None)
+            if len(calls) % 3 == 0:
+                raise RuntimeError("fail")
+
+        profiler = PerformanceProfiler(iterations=3, warmup=1, memory_iterations=1, min_sample_ms=1.0)
+        result = profiler.benchmark("Op", "Engine", every_third_fails)
+
+        # 12 calls precede timing (check + calibration batches of 1 and 10);
+        # calls 13-42 are timed and every third of them (15, 18, ..., 42) fails
+        assert result.inner_loops == 10
+        assert result.success_rate == pytest.approx(20 / 30)
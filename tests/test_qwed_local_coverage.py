@@ -1,4 +1,5 @@
 
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from qwed_sdk.qwed_local import QWEDLocal
@@ -62,6 +63,33 @@ class TestQWEDLocalCoverage(unittest.TestCase):
         # Should not crash
         client.print_cache_stats()
 
+    def test_cache_dir_persists_across_clients(self):
+        """Results cached by one client are served to the next one on the same cache_dir."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = QWEDLocal(base_url="http://mock", cache_dir=cache_dir)
+            first._cache.set("What is 2+2?", {"verified": True, "value": "4"})
+            first._cache.close()
+
+            second = QWEDLocal(base_url="http://mock", cache_dir=cache_dir)
+            self.assertEqual(second._cache.get("what is  2+2?")["value"], "4")
+            self.assertEqual(second.cache_stats.total_entries, 1)
+            second._cache.close()
+
+    def test_logic_cache_entry_not_served_to_verify_math(self):
+        """Math and logic results for the same query text are cached apart."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = QWEDLocal(base_url="http://mock", cache_dir=cache_dir)
+            client._cache.set("logic:Is two plus two four?", {"verified": True, "value": "TRUE"})
+            client._call_llm = MagicMock(return_value='{"answer": "4", "sympy_expr": "2 + 2"}')
+
+            with patch("builtins.print"):
+                result = client.verify_math("Is two plus two four?")
+
+            client._call_llm.assert_called_once()
+            self.assertEqual(result.value, "4")
+            self.assertIsNotNone(client._cache.get("math:Is two plus two four?"))
+            client._cache.close()
+
     def test_check_verifiers_missing(self):
         """Test _check_verifiers when deps are missing."""
         with patch("qwed_sdk.qwed_local.sympy", new=None), \
@@ -200,6 +228,12 @@ class TestQWEDLocalCoverage(unittest.TestCase):
         client.llm_client = MagicMock()
         client.llm_client.chat.completions.create.return_value.choices[0].message.content = "openai_resp"
         self.assertEqual(client._call_llm("prompt"), "openai_resp")
+        self.assertNotIn("response_format", client.llm_client.chat.completions.create.call_args.kwargs)
+        client._call_llm("prompt", json_mode=True)
+        self.assertEqual(
+            client.llm_client.chat.completions.create.call_args.kwargs["response_format"],
+            {"type": "json_object"},
+        )
         
         # 2. Anthropic
         client.client_type = "anthropic"